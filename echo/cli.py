@@ -5,11 +5,16 @@ and ``uninstall`` commands.  The entry point is registered via
 ``pyproject.toml`` as ``echo-copilot = "echo.cli:cli"``.
 """
 
+import atexit
+import functools
 import logging
 import os
+import select
 import signal
+import socket
 import sys
 import time
+from pathlib import Path
 
 import click
 import httpx
@@ -18,6 +23,7 @@ from echo.config import (
     DEFAULT_PORT,
     PID_FILE,
     ECHO_DIR,
+    get_event_socket,
     get_port,
 )
 
@@ -26,6 +32,14 @@ logger = logging.getLogger(__name__)
 # Log file lives alongside the PID file.
 _LOG_FILE = ECHO_DIR / "server.log"
 
+# Entry point for the daemon child.  ``python -m echo`` would put the
+# caller's working directory first on sys.path, so a user's own ``echo.py``
+# or ``echo/`` package could shadow ours; drop that entry before importing.
+_DAEMON_BOOTSTRAP = (
+    "import sys; del sys.path[0]; "
+    "from echo.cli import cli; cli(sys.argv[1:], prog_name='echo-copilot')"
+)
+
 _MIN_PORT = 1024
 _MAX_PORT = 65535
 
@@ -35,6 +49,18 @@ _MAX_PORT = 65535
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
+def _hook_installer():
+    """Import and return the hook installer module on first use.
+
+    Kept out of the module top level so ``status``/``stop`` don't pay
+    for importing it.
+    """
+    from echo.interceptors import hook_installer
+
+    return hook_installer
+
+
 def _resolve_port(port: int | None) -> int:
     """Return the port to use, falling back to env var / default."""
     if port is not None:
@@ -53,13 +79,64 @@ def _validate_port(port: int) -> None:
 def _read_pid() -> int | None:
     """Read the PID from the PID file, or return ``None``."""
     try:
-        return int(PID_FILE.read_text().strip())
-    except (FileNotFoundError, ValueError):
+        fd = os.open(PID_FILE, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        # int() ignores surrounding whitespace, so no decode/strip needed.
+        return int(os.read(fd, 32))
+    except ValueError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _atomic_write_pid(pid: int) -> None:
+    """Write *pid* to the PID file atomically.
+
+    The PID is written to a temporary sibling file, fsynced, and then
+    renamed over ``PID_FILE`` so readers see either no file or a
+    complete one -- never a zero-byte or partially written PID.
+    """
+    tmp_path = f"{PID_FILE}.tmp.{os.getpid()}"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            os.write(fd, str(pid).encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, PID_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _child_is_running(pid: int) -> bool | None:
+    """Check liveness of *pid* if it is a child of this process.
+
+    ``os.kill(pid, 0)`` succeeds for an exited-but-unreaped (zombie)
+    child, so children are checked with ``waitid(WNOWAIT)`` instead,
+    which reports the exit without reaping it.  Returns ``None`` when
+    *pid* is not our child or ``waitid`` is unavailable.
+    """
+    try:
+        result = os.waitid(
+            os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT
+        )
+    except (AttributeError, OSError):
         return None
+    return result is None
 
 
 def _is_process_running(pid: int) -> bool:
     """Return ``True`` if a process with *pid* is alive."""
+    child_running = _child_is_running(pid)
+    if child_running is not None:
+        return child_running
     try:
         os.kill(pid, 0)
         return True
@@ -67,13 +144,46 @@ def _is_process_running(pid: int) -> bool:
         return False
 
 
-def _server_is_responding(port: int) -> bool:
-    """Probe the health endpoint to check if the server is up."""
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Block until process *pid* exits or *timeout* seconds elapse.
+
+    Uses a pidfd on Linux so the kernel wakes us as soon as the process
+    dies.  Falls back to polling where pidfds are unavailable (macOS,
+    older kernels).  Returns ``True`` if the process has exited.
+    """
     try:
-        resp = httpx.get(f"http://127.0.0.1:{port}/health", timeout=2.0)
-        return resp.status_code == 200
-    except (httpx.ConnectError, httpx.TimeoutException, OSError):
-        return False
+        pidfd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        deadline = time.monotonic() + timeout
+        while _is_process_running(pid):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        return True
+
+    try:
+        readable, _, _ = select.select([pidfd], [], [], timeout)
+        return bool(readable)
+    finally:
+        os.close(pidfd)
+
+
+@functools.lru_cache(maxsize=None)
+def _health_client(port: int) -> httpx.Client:
+    """Return a keep-alive HTTP client for the local server on *port*.
+
+    Cached per port so repeated health probes reuse the same connection
+    instead of building a new client and TCP handshake each time.
+    """
+    client = httpx.Client(
+        base_url=f"http://127.0.0.1:{port}",
+        timeout=2.0,
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+    atexit.register(client.close)
+    return client
 
 
 def _setup_logging_to_file() -> None:
@@ -92,6 +202,39 @@ def _setup_logging_to_file() -> None:
     root.addHandler(handler)
 
 
+def _bind_sockets(port: int, event_socket: Path) -> list[socket.socket]:
+    """Bind the listening sockets for the server.
+
+    Returns the loopback TCP socket on *port* plus a Unix-domain socket at
+    *event_socket* that the hook script prefers for ``POST /event`` --
+    it skips the loopback TCP handshake on every hook invocation.  Both
+    serve the same app.  Failing to bind the Unix socket is logged and
+    the server runs on TCP alone.
+    """
+    tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        tcp_sock.bind(("127.0.0.1", port))
+    except OSError:
+        tcp_sock.close()
+        raise
+    sockets = [tcp_sock]
+
+    uds_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        event_socket.parent.mkdir(parents=True, exist_ok=True)
+        event_socket.unlink(missing_ok=True)
+        uds_sock.bind(str(event_socket))
+        os.chmod(event_socket, 0o600)
+    except OSError:
+        uds_sock.close()
+        logger.warning("Could not bind event socket %s", event_socket, exc_info=True)
+    else:
+        sockets.append(uds_sock)
+
+    return sockets
+
+
 def _run_server(port: int) -> None:
     """Start uvicorn with the Echo FastAPI app.
 
@@ -112,57 +255,82 @@ def _run_server(port: int) -> None:
         echo_logger.addHandler(handler)
     echo_logger.setLevel(logging.INFO)
 
-    app = create_app()
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level="info")
+    event_socket = get_event_socket()
+    sockets = _bind_sockets(port, event_socket)
+    previous_handlers: dict = {}
+    try:
+        app = create_app()
+        server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=port, log_level="info")
+        )
 
+        # uvicorn captures SIGTERM/SIGINT while serving and re-raises them
+        # once shut down.  With the default handlers that re-raise kills the
+        # process before any ``finally`` runs and leaves a stale PID file
+        # behind, so install handlers that just request a graceful exit.
+        def _request_exit(signum: int, frame: object) -> None:
+            server.should_exit = True
 
-def _daemonize(port: int) -> None:
-    """Fork into a background daemon process.
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            previous_handlers[sig] = signal.signal(sig, _request_exit)
 
-    The parent writes the child PID to the PID file and exits.
-    The child redirects stdout/stderr to the log file and starts
-    the server.  Unix-only (macOS / Linux).
-    """
-    ECHO_DIR.mkdir(parents=True, exist_ok=True)
-
-    pid = os.fork()
-    if pid > 0:
-        # Parent — record child PID and exit.
-        PID_FILE.write_text(str(pid))
-        click.echo(
-            click.style(f"Server started in background (PID {pid})", fg="green")
-        )
-        click.echo(f"  Logs: {_LOG_FILE}")
-        click.echo(f"  PID file: {PID_FILE}")
-        return
-
-    # Child — detach from terminal.
-    os.setsid()
+        logger.info("Listening on http://127.0.0.1:%d", port)
+        if len(sockets) > 1:
+            logger.info("Listening on unix socket %s", event_socket)
+        server.run(sockets=sockets)
+    finally:
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+        for sock in sockets:
+            sock.close()
+        event_socket.unlink(missing_ok=True)
+        PID_FILE.unlink(missing_ok=True)
 
-    # Redirect stdout/stderr to log file.
-    log_fd = os.open(str(_LOG_FILE), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
-    os.dup2(log_fd, sys.stdout.fileno())
-    os.dup2(log_fd, sys.stderr.fileno())
-    os.close(log_fd)
 
-    # Redirect stdin to /dev/null.
-    devnull = os.open(os.devnull, os.O_RDONLY)
-    os.dup2(devnull, sys.stdin.fileno())
-    os.close(devnull)
+def _daemonize(port: int) -> None:
+    """Start the server as a background daemon process.
+
+    Spawns a fresh interpreter running the hidden ``_daemon_child``
+    command in a new session via ``os.posix_spawn``, with stdin from
+    ``/dev/null`` and stdout/stderr appended to the log file.  Spawning
+    avoids copying this process's page tables and any import-lock state
+    the way ``fork`` would.  The parent records the child PID and
+    returns; if the PID file cannot be written the child is killed.
+    Unix-only (macOS / Linux).
+    """
+    ECHO_DIR.mkdir(parents=True, exist_ok=True)
 
-    _setup_logging_to_file()
+    argv = [sys.executable, "-c", _DAEMON_BOOTSTRAP, "_daemon_child", str(port)]
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+        (
+            os.POSIX_SPAWN_OPEN,
+            1,
+            str(_LOG_FILE),
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o644,
+        ),
+        (os.POSIX_SPAWN_DUP2, 1, 2),
+    ]
+    pid = os.posix_spawn(
+        sys.executable, argv, os.environ, file_actions=file_actions, setsid=True
+    )
 
     try:
-        _run_server(port)
-    except Exception:
-        logger.exception("Daemon server crashed")
-        sys.exit(1)
-    finally:
-        # Clean up PID file when the daemon exits.
+        _atomic_write_pid(pid)
+    except BaseException:
+        # Without a PID file, stop/status could never find the daemon.
         try:
-            PID_FILE.unlink(missing_ok=True)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
         except OSError:
             pass
+        raise
+    click.echo(
+        click.style(f"Server started in background (PID {pid})", fg="green")
+    )
+    click.echo(f"  Logs: {_LOG_FILE}")
+    click.echo(f"  PID file: {PID_FILE}")
 
 
 # ---------------------------------------------------------------------------
@@ -222,9 +390,7 @@ def start(
     # Install hooks unless told to skip.
     if not skip_hooks:
         try:
-            from echo.interceptors.hook_installer import install_hooks
-
-            install_hooks()
+            _hook_installer().install_hooks()
             click.echo(click.style("Hooks installed", fg="green"))
         except Exception as exc:
             click.echo(
@@ -239,7 +405,7 @@ def start(
     else:
         # Foreground mode — write PID for status/stop commands, then block.
         ECHO_DIR.mkdir(parents=True, exist_ok=True)
-        PID_FILE.write_text(str(os.getpid()))
+        _atomic_write_pid(os.getpid())
         try:
             _run_server(port)
         except OSError as exc:
@@ -257,6 +423,25 @@ def start(
             PID_FILE.unlink(missing_ok=True)
 
 
+@cli.command("_daemon_child", hidden=True)
+@click.argument("port", type=int)
+def daemon_child(port: int) -> None:
+    """Run the server inside the process spawned by ``start --daemon``."""
+    _setup_logging_to_file()
+
+    try:
+        _run_server(port)
+    except Exception:
+        logger.exception("Daemon server crashed")
+        sys.exit(1)
+    finally:
+        # Clean up PID file when the daemon exits.
+        try:
+            PID_FILE.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
 # ---------------------------------------------------------------------------
 # stop
 # ---------------------------------------------------------------------------
@@ -284,11 +469,7 @@ def stop() -> None:
     os.kill(pid, signal.SIGTERM)
 
     # Wait up to 5 seconds for the process to exit.
-    for _ in range(50):
-        if not _is_process_running(pid):
-            break
-        time.sleep(0.1)
-    else:
+    if not _wait_for_exit(pid, 5.0):
         click.echo(
             click.style(
                 f"Process {pid} did not exit in time — sending SIGKILL.", fg="red"
@@ -330,9 +511,13 @@ def status(port: int | None) -> None:
 
     click.echo(f"Server process is running (PID {pid}).")
 
-    if _server_is_responding(port):
+    try:
+        resp = _health_client(port).get("/health")
+    except (httpx.RequestError, OSError):
+        resp = None
+
+    if resp is not None and resp.status_code == 200:
         try:
-            resp = httpx.get(f"http://127.0.0.1:{port}/health", timeout=2.0)
             data = resp.json()
             click.echo(click.style("Server is healthy.", fg="green"))
             click.echo(f"  Version:     {data.get('version', '?')}")
@@ -358,9 +543,7 @@ def status(port: int | None) -> None:
 def install_hooks_cmd() -> None:
     """Manually install Claude Code hooks."""
     try:
-        from echo.interceptors.hook_installer import install_hooks
-
-        install_hooks()
+        _hook_installer().install_hooks()
         click.echo(click.style("Hooks installed successfully.", fg="green"))
     except Exception as exc:
         click.echo(click.style(f"Failed to install hooks: {exc}", fg="red"))
@@ -384,18 +567,13 @@ def uninstall() -> None:
     if pid is not None and _is_process_running(pid):
         click.echo(f"Stopping running server (PID {pid})...")
         os.kill(pid, signal.SIGTERM)
-        for _ in range(50):
-            if not _is_process_running(pid):
-                break
-            time.sleep(0.1)
+        _wait_for_exit(pid, 5.0)
         PID_FILE.unlink(missing_ok=True)
         click.echo(click.style("Server stopped.", fg="green"))
 
     # Uninstall hooks.
     try:
-        from echo.interceptors.hook_installer import uninstall_hooks
-
-        uninstall_hooks()
+        _hook_installer().uninstall_hooks()
         click.echo(click.style("Hooks uninstalled.", fg="green"))
     except Exception as exc:
         click.echo(click.style(f"Failed to uninstall hooks: {exc}", fg="red"))
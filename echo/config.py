@@ -1,14 +1,26 @@
-"""Configuration constants and helpers for Echo."""
+"""Configuration constants and helpers for Echo.
 
+Only the universal constants (port, paths) are evaluated at import time.
+Provider settings are parsed from the environment on first use by cached
+accessor functions such as :func:`elevenlabs_settings`, so lightweight CLI
+commands like ``status`` never touch them.  The flat ``UPPER_SNAKE_CASE``
+names (``ELEVENLABS_API_KEY``, ``STT_TIMEOUT``, ...) remain importable and
+resolve lazily through those accessors.
+"""
+
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 # Load .env from the project root (if present) so that env vars are
-# available even when the user hasn't explicitly exported them.
+# available even when the user hasn't explicitly exported them.  dotenv
+# is only imported when there is actually a file to load.
 _project_env = Path(__file__).resolve().parent.parent / ".env"
-load_dotenv(_project_env, override=False)
+if _project_env.is_file():
+    from dotenv import load_dotenv
+
+    load_dotenv(_project_env, override=False)
 
 DEFAULT_PORT: int = 7865
 
@@ -18,6 +30,9 @@ CLAUDE_PROJECTS_PATH: Path = Path.home() / ".claude" / "projects"
 ECHO_DIR: Path = Path.home() / ".echo-copilot"
 HOOKS_DIR: Path = ECHO_DIR / "hooks"
 PID_FILE: Path = ECHO_DIR / "server.pid"
+EVENT_SOCKET: Path = ECHO_DIR / "events.sock"
+
+OLLAMA_HEALTH_CHECK_INTERVAL: float = 60.0  # Re-check Ollama availability every 60s
 
 
 def get_port() -> int:
@@ -31,91 +46,261 @@ def get_port() -> int:
     return DEFAULT_PORT
 
 
+def get_event_socket() -> Path:
+    """Return the hook event socket path from ECHO_EVENT_SOCKET, or EVENT_SOCKET."""
+    raw = os.environ.get("ECHO_EVENT_SOCKET")
+    if raw:
+        return Path(raw)
+    return EVENT_SOCKET
+
+
 # --- Ollama / LLM configuration ---
 
-OLLAMA_BASE_URL: str = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
-OLLAMA_MODEL: str = os.environ.get("ECHO_LLM_MODEL", "qwen2.5:0.5b")
-OLLAMA_TIMEOUT: float = float(os.environ.get("ECHO_LLM_TIMEOUT", "5.0"))
-OLLAMA_HEALTH_CHECK_INTERVAL: float = 60.0  # Re-check Ollama availability every 60s
+
+@dataclass(frozen=True)
+class OllamaSettings:
+    base_url: str
+    model: str
+    timeout: float
+
+
+@functools.cache
+def ollama_settings() -> OllamaSettings:
+    return OllamaSettings(
+        base_url=os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434"),
+        model=os.environ.get("ECHO_LLM_MODEL", "qwen2.5:0.5b"),
+        timeout=float(os.environ.get("ECHO_LLM_TIMEOUT", "5.0")),
+    )
 
 
 # --- TTS provider selection ---
 
-TTS_PROVIDER: str = os.environ.get("ECHO_TTS_PROVIDER", "elevenlabs")
+
+@functools.cache
+def tts_provider() -> str:
+    return os.environ.get("ECHO_TTS_PROVIDER", "elevenlabs")
 
 
 # --- ElevenLabs TTS configuration ---
 
-ELEVENLABS_API_KEY: str = os.environ.get("ECHO_ELEVENLABS_API_KEY", "")
-ELEVENLABS_BASE_URL: str = os.environ.get(
-    "ECHO_ELEVENLABS_BASE_URL", "https://api.elevenlabs.io"
-)
-TTS_VOICE_ID: str = os.environ.get("ECHO_TTS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
-TTS_MODEL: str = os.environ.get("ECHO_TTS_MODEL", "eleven_turbo_v2_5")
-TTS_TIMEOUT: float = float(os.environ.get("ECHO_TTS_TIMEOUT", "10.0"))
-TTS_HEALTH_CHECK_INTERVAL: float = float(
-    os.environ.get("ECHO_TTS_HEALTH_CHECK_INTERVAL", "60.0")
-)
+
+@dataclass(frozen=True)
+class ElevenLabsSettings:
+    api_key: str
+    base_url: str
+    voice_id: str
+    model: str
+    timeout: float
+    health_check_interval: float
+
+
+@functools.cache
+def elevenlabs_settings() -> ElevenLabsSettings:
+    return ElevenLabsSettings(
+        api_key=os.environ.get("ECHO_ELEVENLABS_API_KEY", ""),
+        base_url=os.environ.get(
+            "ECHO_ELEVENLABS_BASE_URL", "https://api.elevenlabs.io"
+        ),
+        voice_id=os.environ.get("ECHO_TTS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM"),
+        model=os.environ.get("ECHO_TTS_MODEL", "eleven_turbo_v2_5"),
+        timeout=float(os.environ.get("ECHO_TTS_TIMEOUT", "10.0")),
+        health_check_interval=float(
+            os.environ.get("ECHO_TTS_HEALTH_CHECK_INTERVAL", "60.0")
+        ),
+    )
 
 
 # --- Inworld TTS configuration ---
 
-INWORLD_API_KEY: str = os.environ.get("ECHO_INWORLD_API_KEY", "")
-INWORLD_BASE_URL: str = os.environ.get(
-    "ECHO_INWORLD_BASE_URL", "https://api.inworld.ai"
-)
-INWORLD_VOICE_ID: str = os.environ.get("ECHO_INWORLD_VOICE_ID", "Ashley")
-INWORLD_MODEL: str = os.environ.get(
-    "ECHO_INWORLD_MODEL", "inworld-tts-1.5-max"
-)
-INWORLD_TIMEOUT: float = float(os.environ.get("ECHO_INWORLD_TIMEOUT", "10.0"))
-INWORLD_TEMPERATURE: float = float(
-    os.environ.get("ECHO_INWORLD_TEMPERATURE", "1.1")
-)
-INWORLD_SPEAKING_RATE: float = float(
-    os.environ.get("ECHO_INWORLD_SPEAKING_RATE", "1.0")
-)
+
+@dataclass(frozen=True)
+class InworldSettings:
+    api_key: str
+    base_url: str
+    voice_id: str
+    model: str
+    timeout: float
+    temperature: float
+    speaking_rate: float
+
+
+@functools.cache
+def inworld_settings() -> InworldSettings:
+    return InworldSettings(
+        api_key=os.environ.get("ECHO_INWORLD_API_KEY", ""),
+        base_url=os.environ.get("ECHO_INWORLD_BASE_URL", "https://api.inworld.ai"),
+        voice_id=os.environ.get("ECHO_INWORLD_VOICE_ID", "Ashley"),
+        model=os.environ.get("ECHO_INWORLD_MODEL", "inworld-tts-1.5-max"),
+        timeout=float(os.environ.get("ECHO_INWORLD_TIMEOUT", "10.0")),
+        temperature=float(os.environ.get("ECHO_INWORLD_TEMPERATURE", "1.1")),
+        speaking_rate=float(os.environ.get("ECHO_INWORLD_SPEAKING_RATE", "1.0")),
+    )
 
 
 # --- LiveKit configuration ---
 
-LIVEKIT_URL: str = os.environ.get("LIVEKIT_URL", "")
-LIVEKIT_API_KEY: str = os.environ.get("LIVEKIT_API_KEY", "")
-LIVEKIT_API_SECRET: str = os.environ.get("LIVEKIT_API_SECRET", "")
+
+@dataclass(frozen=True)
+class LiveKitSettings:
+    url: str
+    api_key: str
+    api_secret: str
+
+
+@functools.cache
+def livekit_settings() -> LiveKitSettings:
+    return LiveKitSettings(
+        url=os.environ.get("LIVEKIT_URL", ""),
+        api_key=os.environ.get("LIVEKIT_API_KEY", ""),
+        api_secret=os.environ.get("LIVEKIT_API_SECRET", ""),
+    )
 
 
 # --- Audio pipeline configuration ---
 
-AUDIO_SAMPLE_RATE: int = int(os.environ.get("ECHO_AUDIO_SAMPLE_RATE", "16000"))
-AUDIO_BACKLOG_THRESHOLD: int = int(
-    os.environ.get("ECHO_AUDIO_BACKLOG_THRESHOLD", "3")
-)
+
+@dataclass(frozen=True)
+class AudioSettings:
+    sample_rate: int
+    backlog_threshold: int
+
+
+@functools.cache
+def audio_settings() -> AudioSettings:
+    return AudioSettings(
+        sample_rate=int(os.environ.get("ECHO_AUDIO_SAMPLE_RATE", "16000")),
+        backlog_threshold=int(os.environ.get("ECHO_AUDIO_BACKLOG_THRESHOLD", "3")),
+    )
 
 
 # --- Alert configuration ---
 
-ALERT_REPEAT_INTERVAL: float = float(
-    os.environ.get("ECHO_ALERT_REPEAT_INTERVAL", "30.0")
-)  # Seconds between repeat alerts. 0 = no repeat.
 
-ALERT_MAX_REPEATS: int = int(
-    os.environ.get("ECHO_ALERT_MAX_REPEATS", "5")
-)  # Maximum number of repeat alerts before stopping.
+@dataclass(frozen=True)
+class AlertSettings:
+    repeat_interval: float  # Seconds between repeat alerts. 0 = no repeat.
+    max_repeats: int  # Maximum number of repeat alerts before stopping.
+
+
+@functools.cache
+def alert_settings() -> AlertSettings:
+    return AlertSettings(
+        repeat_interval=float(os.environ.get("ECHO_ALERT_REPEAT_INTERVAL", "30.0")),
+        max_repeats=int(os.environ.get("ECHO_ALERT_MAX_REPEATS", "5")),
+    )
 
 
 # --- STT / Speech-to-Text configuration ---
 
-STT_API_KEY: str = os.environ.get("ECHO_STT_API_KEY", "")
-STT_BASE_URL: str = os.environ.get("ECHO_STT_BASE_URL", "https://api.openai.com")
-STT_MODEL: str = os.environ.get("ECHO_STT_MODEL", "whisper-1")
-STT_TIMEOUT: float = float(os.environ.get("ECHO_STT_TIMEOUT", "10.0"))
-STT_LISTEN_TIMEOUT: float = float(os.environ.get("ECHO_STT_LISTEN_TIMEOUT", "30.0"))
-STT_SILENCE_THRESHOLD: float = float(os.environ.get("ECHO_STT_SILENCE_THRESHOLD", "0.01"))
-STT_SILENCE_DURATION: float = float(os.environ.get("ECHO_STT_SILENCE_DURATION", "1.5"))
-STT_MAX_RECORD_DURATION: float = float(os.environ.get("ECHO_STT_MAX_RECORD_DURATION", "15.0"))
-STT_CONFIDENCE_THRESHOLD: float = float(os.environ.get("ECHO_STT_CONFIDENCE_THRESHOLD", "0.6"))
-STT_HEALTH_CHECK_INTERVAL: float = float(os.environ.get("ECHO_STT_HEALTH_CHECK_INTERVAL", "60.0"))
+
+@dataclass(frozen=True)
+class STTSettings:
+    api_key: str
+    base_url: str
+    model: str
+    timeout: float
+    listen_timeout: float
+    silence_threshold: float
+    silence_duration: float
+    max_record_duration: float
+    confidence_threshold: float
+    health_check_interval: float
+
+
+@functools.cache
+def stt_settings() -> STTSettings:
+    return STTSettings(
+        api_key=os.environ.get("ECHO_STT_API_KEY", ""),
+        base_url=os.environ.get("ECHO_STT_BASE_URL", "https://api.openai.com"),
+        model=os.environ.get("ECHO_STT_MODEL", "whisper-1"),
+        timeout=float(os.environ.get("ECHO_STT_TIMEOUT", "10.0")),
+        listen_timeout=float(os.environ.get("ECHO_STT_LISTEN_TIMEOUT", "30.0")),
+        silence_threshold=float(os.environ.get("ECHO_STT_SILENCE_THRESHOLD", "0.01")),
+        silence_duration=float(os.environ.get("ECHO_STT_SILENCE_DURATION", "1.5")),
+        max_record_duration=float(
+            os.environ.get("ECHO_STT_MAX_RECORD_DURATION", "15.0")
+        ),
+        confidence_threshold=float(
+            os.environ.get("ECHO_STT_CONFIDENCE_THRESHOLD", "0.6")
+        ),
+        health_check_interval=float(
+            os.environ.get("ECHO_STT_HEALTH_CHECK_INTERVAL", "60.0")
+        ),
+    )
+
 
 # --- Response dispatch configuration ---
 
-DISPATCH_METHOD: str = os.environ.get("ECHO_DISPATCH_METHOD", "")
+
+@functools.cache
+def dispatch_method() -> str:
+    return os.environ.get("ECHO_DISPATCH_METHOD", "")
+
+
+@functools.cache
+def dispatch_paste_threshold() -> int:
+    # AppleScript only.  Text longer than this is pasted via the clipboard
+    # instead of typed.  0 = always type (never touch the clipboard).
+    return int(os.environ.get("ECHO_DISPATCH_PASTE_THRESHOLD", "0"))
+
+
+# --- Flat constant names (resolved lazily) ---
+
+_LAZY_CONSTANTS = {
+    "OLLAMA_BASE_URL": lambda: ollama_settings().base_url,
+    "OLLAMA_MODEL": lambda: ollama_settings().model,
+    "OLLAMA_TIMEOUT": lambda: ollama_settings().timeout,
+    "TTS_PROVIDER": tts_provider,
+    "ELEVENLABS_API_KEY": lambda: elevenlabs_settings().api_key,
+    "ELEVENLABS_BASE_URL": lambda: elevenlabs_settings().base_url,
+    "TTS_VOICE_ID": lambda: elevenlabs_settings().voice_id,
+    "TTS_MODEL": lambda: elevenlabs_settings().model,
+    "TTS_TIMEOUT": lambda: elevenlabs_settings().timeout,
+    "TTS_HEALTH_CHECK_INTERVAL": lambda: elevenlabs_settings().health_check_interval,
+    "INWORLD_API_KEY": lambda: inworld_settings().api_key,
+    "INWORLD_BASE_URL": lambda: inworld_settings().base_url,
+    "INWORLD_VOICE_ID": lambda: inworld_settings().voice_id,
+    "INWORLD_MODEL": lambda: inworld_settings().model,
+    "INWORLD_TIMEOUT": lambda: inworld_settings().timeout,
+    "INWORLD_TEMPERATURE": lambda: inworld_settings().temperature,
+    "INWORLD_SPEAKING_RATE": lambda: inworld_settings().speaking_rate,
+    "LIVEKIT_URL": lambda: livekit_settings().url,
+    "LIVEKIT_API_KEY": lambda: livekit_settings().api_key,
+    "LIVEKIT_API_SECRET": lambda: livekit_settings().api_secret,
+    "AUDIO_SAMPLE_RATE": lambda: audio_settings().sample_rate,
+    "AUDIO_BACKLOG_THRESHOLD": lambda: audio_settings().backlog_threshold,
+    "ALERT_REPEAT_INTERVAL": lambda: alert_settings().repeat_interval,
+    "ALERT_MAX_REPEATS": lambda: alert_settings().max_repeats,
+    "STT_API_KEY": lambda: stt_settings().api_key,
+    "STT_BASE_URL": lambda: stt_settings().base_url,
+    "STT_MODEL": lambda: stt_settings().model,
+    "STT_TIMEOUT": lambda: stt_settings().timeout,
+    "STT_LISTEN_TIMEOUT": lambda: stt_settings().listen_timeout,
+    "STT_SILENCE_THRESHOLD": lambda: stt_settings().silence_threshold,
+    "STT_SILENCE_DURATION": lambda: stt_settings().silence_duration,
+    "STT_MAX_RECORD_DURATION": lambda: stt_settings().max_record_duration,
+    "STT_CONFIDENCE_THRESHOLD": lambda: stt_settings().confidence_threshold,
+    "STT_HEALTH_CHECK_INTERVAL": lambda: stt_settings().health_check_interval,
+    "DISPATCH_METHOD": dispatch_method,
+    "DISPATCH_PASTE_THRESHOLD": dispatch_paste_threshold,
+}
+
+
+def _reset_for_tests() -> None:
+    """Clear every cached settings accessor so env-var changes take effect."""
+    for value in list(globals().values()):
+        cache_clear = getattr(value, "cache_clear", None)
+        if callable(cache_clear):
+            cache_clear()
+
+
+def __getattr__(name: str):
+    try:
+        resolve = _LAZY_CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return resolve()
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_CONSTANTS])
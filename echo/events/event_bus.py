@@ -18,53 +18,76 @@ class EventBus(Generic[T]):
     it is pushed to every active subscriber queue. If a subscriber's
     queue is full the event is dropped for that subscriber (with a
     warning) so that slow consumers never block the producer.
+    Subscribers created with ``drop_oldest=True`` instead discard their
+    oldest queued event to make room, so they always see the latest ones.
     """
 
     def __init__(self, maxsize: int = _DEFAULT_QUEUE_SIZE) -> None:
-        self._subscribers: list[asyncio.Queue[T]] = []
+        # Copy-on-write: subscribe/unsubscribe swap in a new tuple, so
+        # emit can iterate the current one without taking the lock.
+        self._subscribers: tuple[asyncio.Queue[T], ...] = ()
+        self._drop_oldest: set[asyncio.Queue[T]] = set()
         self._lock = asyncio.Lock()
         self._maxsize = maxsize
+        self._dropped = 0
 
     async def emit(self, event: T) -> None:
         """Push *event* to every subscriber queue.
 
         Queues that are full receive a warning log and the event is
-        silently dropped for that subscriber.
+        silently dropped for that subscriber, or replaces the oldest
+        queued event for ``drop_oldest`` subscribers.
         """
-        async with self._lock:
-            subscribers = list(self._subscribers)
-
-        for queue in subscribers:
+        for queue in self._subscribers:
             try:
                 queue.put_nowait(event)
             except asyncio.QueueFull:
+                self._dropped += 1
+                if queue in self._drop_oldest:
+                    queue.get_nowait()
+                    queue.put_nowait(event)
+                    logger.warning(
+                        "Subscriber queue full — dropping oldest event for "
+                        "one subscriber"
+                    )
+                    continue
                 logger.warning(
                     "Subscriber queue full — dropping event %s for one subscriber",
                     getattr(event, "type", type(event).__name__),
                 )
 
-    async def subscribe(self) -> asyncio.Queue[T]:
-        """Create and return a new subscriber queue."""
+    async def subscribe(self, drop_oldest: bool = False) -> asyncio.Queue[T]:
+        """Create and return a new subscriber queue.
+
+        With *drop_oldest*, a full queue discards its oldest event to make
+        room for a new one instead of dropping the new event.
+        """
         queue: asyncio.Queue[T] = asyncio.Queue(
             maxsize=self._maxsize,
         )
         async with self._lock:
-            self._subscribers.append(queue)
+            self._subscribers = (*self._subscribers, queue)
+            if drop_oldest:
+                self._drop_oldest.add(queue)
         logger.debug("New subscriber added (total: %d)", len(self._subscribers))
         return queue
 
     async def unsubscribe(self, queue: asyncio.Queue[T]) -> None:
         """Remove a subscriber queue.  No-op if the queue is not registered."""
         async with self._lock:
-            try:
-                self._subscribers.remove(queue)
-                logger.debug(
-                    "Subscriber removed (remaining: %d)", len(self._subscribers)
-                )
-            except ValueError:
+            if queue not in self._subscribers:
                 logger.debug("Attempted to unsubscribe an unknown queue — ignoring")
+                return
+            self._subscribers = tuple(q for q in self._subscribers if q is not queue)
+            self._drop_oldest.discard(queue)
+        logger.debug("Subscriber removed (remaining: %d)", len(self._subscribers))
 
     @property
     def subscriber_count(self) -> int:
         """Return the current number of active subscribers."""
         return len(self._subscribers)
+
+    @property
+    def dropped_count(self) -> int:
+        """Return how many events have been dropped on full subscriber queues."""
+        return self._dropped
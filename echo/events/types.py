@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Literal, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class EventType(str, Enum):
@@ -36,13 +36,22 @@ class EchoEvent(BaseModel):
       - agent_blocked: block_reason, message, options
       - agent_message: text
       - agent_stopped: stop_reason
+
+    Events are frozen: one instance is fanned out to every subscriber, so
+    none of them may mutate it.  That also lets :meth:`json_str` serialise
+    the event once and share the result between subscribers.
     """
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    _json_cache: str | None = PrivateAttr(default=None)
+    _sse_frame_cache: bytes | None = PrivateAttr(default=None)
+
     type: EventType
     timestamp: float = Field(default_factory=time.time)
     session_id: str
     source: Literal["hook", "transcript"]
-    event_id: str = Field(default_factory=lambda: str(uuid4()))
+    event_id: str = Field(default_factory=lambda: uuid4().hex)
 
     # tool_executed
     tool_name: str | None = None
@@ -59,3 +68,23 @@ class EchoEvent(BaseModel):
 
     # agent_stopped
     stop_reason: str | None = None
+
+    def json_str(self) -> str:
+        """Return the event serialised as JSON, computed on first use."""
+        if self._json_cache is None:
+            self._json_cache = self.model_dump_json()
+        return self._json_cache
+
+    def sse_frame(self) -> bytes:
+        """Return the event as an encoded SSE message, computed on first use.
+
+        The event name is ``type.value`` and the data line is
+        :meth:`json_str`, which never contains a newline.  Lines end in
+        ``\\r\\n`` to match ``EventSourceResponse``'s default separator.
+        """
+        if self._sse_frame_cache is None:
+            self._sse_frame_cache = (
+                f"event: {self.type.value}\r\n"
+                f"data: {self.json_str()}\r\n\r\n"
+            ).encode()
+        return self._sse_frame_cache
@@ -4,7 +4,10 @@
 # Claude Code invokes this script as a hook, passing event JSON on stdin.
 # We read the JSON and POST it to the local Echo FastAPI server.
 #
-# The server port can be overridden via the ECHO_PORT env var.
+# The server also listens on a Unix-domain socket in ~/.echo-copilot; when
+# it exists we POST over it to skip the loopback TCP handshake, falling
+# back to TCP otherwise.  The socket path can be overridden via the
+# ECHO_EVENT_SOCKET env var and the server port via ECHO_PORT.
 # If the server is not running the curl will fail silently and the script
 # still exits 0 so that Claude Code is never blocked by an error.
 
@@ -12,11 +15,25 @@ set -euo pipefail
 
 INPUT=$(cat)
 PORT="${ECHO_PORT:-7865}"
+SOCKET="${ECHO_EVENT_SOCKET:-$HOME/.echo-copilot/events.sock}"
 
 # POST to Echo server.
 # -s  silent (no progress meter)
 # -f  fail silently on HTTP errors
 # --max-time 5  don't hang if the server is slow
+if [ -S "$SOCKET" ]; then
+  RC=0
+  curl -sf --max-time 5 --unix-socket "$SOCKET" \
+    -X POST "http://localhost/event" \
+    -H "Content-Type: application/json" \
+    -d "$INPUT" > /dev/null 2>&1 || RC=$?
+  # Exit code 7 means nothing is listening (stale socket) -- retry over TCP.
+  # Any other outcome reached the server, so don't post the event twice.
+  if [ "$RC" -ne 7 ]; then
+    exit 0
+  fi
+fi
+
 curl -sf --max-time 5 \
   -X POST "http://localhost:${PORT}/event" \
   -H "Content-Type: application/json" \
@@ -1,18 +1,36 @@
 """Parse raw Claude Code hook JSON into EchoEvent instances."""
 
 import logging
+import time
+from typing import Callable
+from uuid import uuid4
 
 from echo.events.types import BlockReason, EventType, EchoEvent
 
 logger = logging.getLogger(__name__)
 
-# Claude Code hook event names we handle.
-_HOOK_POST_TOOL_USE = "PostToolUse"
-_HOOK_NOTIFICATION = "Notification"
-_HOOK_PERMISSION_REQUEST = "PermissionRequest"
-_HOOK_STOP = "Stop"
-_HOOK_SESSION_START = "SessionStart"
-_HOOK_SESSION_END = "SessionEnd"
+# Keyword -> block reason, checked in order.  The message-body fallback
+# only looks for the permission and idle keywords.
+_TYPE_KEYWORDS: tuple[tuple[str, BlockReason], ...] = (
+    ("permission", BlockReason.PERMISSION_PROMPT),
+    ("idle", BlockReason.IDLE_PROMPT),
+    ("question", BlockReason.QUESTION),
+)
+_MESSAGE_KEYWORDS = _TYPE_KEYWORDS[:2]
+
+# Expected Python types for the payload-derived EchoEvent fields.  When all
+# of them match, the event can be built without running pydantic validation.
+_FIELD_TYPES: dict[str, type] = {
+    "session_id": str,
+    "tool_name": str,
+    "tool_input": dict,
+    "tool_output": dict,
+    "message": str,
+    "stop_reason": str,
+}
+# Payload-derived fields the model requires; ``None`` is only trusted for
+# the optional ones.
+_REQUIRED_FIELDS = frozenset({"session_id"})
 
 
 def parse_hook_event(raw_json: dict) -> EchoEvent | None:
@@ -33,26 +51,14 @@ def parse_hook_event(raw_json: dict) -> EchoEvent | None:
     )
 
     try:
-        if hook_event_name == _HOOK_POST_TOOL_USE:
-            return _parse_post_tool_use(raw_json, session_id)
+        parser = _PARSERS.get(hook_event_name)
+        if parser is None:
+            logger.warning(
+                "Unrecognised hook event name: %r — skipping", hook_event_name
+            )
+            return None
 
-        if hook_event_name == _HOOK_NOTIFICATION:
-            return _parse_notification(raw_json, session_id)
-
-        if hook_event_name == _HOOK_PERMISSION_REQUEST:
-            return _parse_permission_request(raw_json, session_id)
-
-        if hook_event_name == _HOOK_STOP:
-            return _parse_stop(raw_json, session_id)
-
-        if hook_event_name == _HOOK_SESSION_START:
-            return _parse_session_start(raw_json, session_id)
-
-        if hook_event_name == _HOOK_SESSION_END:
-            return _parse_session_end(raw_json, session_id)
-
-        logger.warning("Unrecognised hook event name: %r — skipping", hook_event_name)
-        return None
+        return parser(raw_json, session_id)
 
     except Exception:
         logger.exception(
@@ -63,6 +69,51 @@ def parse_hook_event(raw_json: dict) -> EchoEvent | None:
         return None
 
 
+# ---------------------------------------------------------------------------
+# Event construction
+# ---------------------------------------------------------------------------
+
+
+def _uuid4_hex() -> str:
+    """Return a fresh random event ID."""
+    return uuid4().hex
+
+
+def _fields_are_trusted(fields: dict) -> bool:
+    """Return ``True`` if every payload-derived field already has its model type."""
+    for name, value in fields.items():
+        if value is None:
+            if name in _REQUIRED_FIELDS:
+                return False
+            continue
+        if name == "options":
+            if not isinstance(value, list) or not all(
+                isinstance(opt, str) for opt in value
+            ):
+                return False
+            continue
+        expected = _FIELD_TYPES.get(name)
+        if expected is not None and not isinstance(value, expected):
+            return False
+    return True
+
+
+def _build_event(**fields) -> EchoEvent:
+    """Build an ``EchoEvent`` from parser output.
+
+    The parsers only ever pass trusted enums and literals for ``type``,
+    ``source``, and ``block_reason``, so when the payload-derived fields
+    also have the right types the event is assembled via
+    ``model_construct`` and skips validation.  Anything else goes through
+    the validating constructor, which raises on malformed payloads.
+    """
+    if _fields_are_trusted(fields):
+        return EchoEvent.model_construct(
+            timestamp=time.time(), event_id=_uuid4_hex(), **fields
+        )
+    return EchoEvent(**fields)
+
+
 # ---------------------------------------------------------------------------
 # Per-event parsers
 # ---------------------------------------------------------------------------
@@ -74,13 +125,14 @@ def _parse_post_tool_use(raw: dict, session_id: str) -> EchoEvent:
     tool_input: dict | None = raw.get("tool_input")
     tool_output: dict | None = raw.get("tool_response")
 
-    logger.debug(
-        "PostToolUse: tool_name=%s input_keys=%s",
-        tool_name,
-        list(tool_input.keys()) if isinstance(tool_input, dict) else None,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "PostToolUse: tool_name=%s input_keys=%s",
+            tool_name,
+            list(tool_input.keys()) if isinstance(tool_input, dict) else None,
+        )
 
-    return EchoEvent(
+    return _build_event(
         type=EventType.TOOL_EXECUTED,
         session_id=session_id,
         source="hook",
@@ -100,22 +152,23 @@ def _parse_permission_request(raw: dict, session_id: str) -> EchoEvent:
     tool_name: str = raw.get("tool_name", "unknown tool")
     tool_input: dict | None = raw.get("tool_input")
 
-    message = _build_permission_message(tool_name, tool_input)
+    # For AskUserQuestion, use the actual question option labels so
+    # the narration reads them and STT can match spoken responses.
+    options: list[str] = ["Allow", "Deny"]
+    if tool_name == "AskUserQuestion" and tool_input and isinstance(tool_input, dict):
+        question_text, labels = _extract_question(tool_input)
+        message = _build_ask_user_question_message(question_text, labels)
+        if labels:
+            options = labels
+    else:
+        message = _build_permission_message(tool_name, tool_input)
 
     logger.debug(
         "PermissionRequest: tool_name=%s message=%s",
         tool_name, message,
     )
 
-    # For AskUserQuestion, use the actual question option labels so
-    # the narration reads them and STT can match spoken responses.
-    options: list[str] = ["Allow", "Deny"]
-    if tool_name == "AskUserQuestion" and tool_input:
-        question_options = _extract_question_option_labels(tool_input)
-        if question_options:
-            options = question_options
-
-    return EchoEvent(
+    return _build_event(
         type=EventType.AGENT_BLOCKED,
         session_id=session_id,
         source="hook",
@@ -136,59 +189,37 @@ def _build_permission_message(tool_name: str, tool_input: dict | None) -> str:
             return f"Claude wants to write to: {tool_input['file_path']}"
         if tool_name == "Edit" and "file_path" in tool_input:
             return f"Claude wants to edit: {tool_input['file_path']}"
-        if tool_name == "AskUserQuestion":
-            return _build_ask_user_question_message(tool_input)
     return f"Claude wants to use {tool_name}"
 
 
-def _extract_question_option_labels(tool_input: dict) -> list[str] | None:
-    """Extract option labels from AskUserQuestion tool_input.
+def _extract_question(tool_input: dict) -> tuple[str, list[str]]:
+    """Extract the first question's text and option labels from AskUserQuestion tool_input.
 
-    Returns a list of label strings, or None if extraction fails.
+    Returns ``("", [])`` when the payload carries no usable question.
     """
     questions = tool_input.get("questions")
     if not questions or not isinstance(questions, list):
-        return None
-    first_q = questions[0]
-    if not isinstance(first_q, dict):
-        return None
-    options = first_q.get("options", [])
-    if not options or not isinstance(options, list):
-        return None
-    labels = []
-    for opt in options:
-        if isinstance(opt, dict):
-            labels.append(opt.get("label", str(opt)))
-        else:
-            labels.append(str(opt))
-    return labels if labels else None
-
-
-def _build_ask_user_question_message(tool_input: dict) -> str:
-    """Extract the actual question and options from AskUserQuestion tool_input."""
-    questions = tool_input.get("questions")
-    if not questions or not isinstance(questions, list):
-        return "Claude wants to ask you a question"
-
+        return "", []
     first_q = questions[0]
     if not isinstance(first_q, dict):
-        return "Claude wants to ask you a question"
-
-    question_text = first_q.get("question", "")
-    options = first_q.get("options", [])
-
-    parts = [f"Claude is asking: {question_text}"] if question_text else ["Claude wants to ask you a question"]
+        return "", []
 
+    labels: list[str] = []
+    options = first_q.get("options")
     if options and isinstance(options, list):
-        option_labels = []
         for opt in options:
             if isinstance(opt, dict):
-                option_labels.append(opt.get("label", str(opt)))
+                labels.append(opt.get("label", str(opt)))
             else:
-                option_labels.append(str(opt))
-        if option_labels:
-            parts.append("The choices are: " + ", ".join(option_labels))
+                labels.append(str(opt))
+    return first_q.get("question", ""), labels
+
 
+def _build_ask_user_question_message(question_text: str, labels: list[str]) -> str:
+    """Build the narration message for an AskUserQuestion permission request."""
+    parts = [f"Claude is asking: {question_text}"] if question_text else ["Claude wants to ask you a question"]
+    if labels:
+        parts.append("The choices are: " + ", ".join(labels))
     return " ".join(parts)
 
 
@@ -210,7 +241,7 @@ def _parse_notification(raw: dict, session_id: str) -> EchoEvent:
         block_reason,
     )
 
-    return EchoEvent(
+    return _build_event(
         type=EventType.AGENT_BLOCKED,
         session_id=session_id,
         source="hook",
@@ -228,22 +259,16 @@ def _infer_block_reason(
     Checks the explicit ``type`` field first.  If that is not conclusive,
     falls back to keyword matching against the ``message`` body.
     """
-    lowered = notification_type.lower()
-
-    if "permission" in lowered:
-        return BlockReason.PERMISSION_PROMPT
-    if "idle" in lowered:
-        return BlockReason.IDLE_PROMPT
-    if "question" in lowered:
-        return BlockReason.QUESTION
+    if notification_type:
+        reason = _match_keywords(notification_type, _TYPE_KEYWORDS)
+        if reason is not None:
+            return reason
 
     # Fallback: inspect message content.
     if message:
-        msg_lower = message.lower()
-        if "permission" in msg_lower:
-            return BlockReason.PERMISSION_PROMPT
-        if "idle" in msg_lower:
-            return BlockReason.IDLE_PROMPT
+        reason = _match_keywords(message, _MESSAGE_KEYWORDS)
+        if reason is not None:
+            return reason
 
     logger.debug(
         "Could not determine block_reason from notification_type=%r, message=%r",
@@ -253,13 +278,24 @@ def _infer_block_reason(
     return None
 
 
+def _match_keywords(
+    text: str, keywords: tuple[tuple[str, BlockReason], ...]
+) -> BlockReason | None:
+    """Return the reason for the first keyword found in *text*, case-insensitively."""
+    lowered = text.lower()
+    for keyword, reason in keywords:
+        if keyword in lowered:
+            return reason
+    return None
+
+
 def _parse_stop(raw: dict, session_id: str) -> EchoEvent:
     """Map a ``Stop`` hook payload to ``EventType.AGENT_STOPPED``."""
     stop_reason: str | None = raw.get("stop_reason") or raw.get("reason")
 
     logger.debug("Stop: stop_reason=%s", stop_reason)
 
-    return EchoEvent(
+    return _build_event(
         type=EventType.AGENT_STOPPED,
         session_id=session_id,
         source="hook",
@@ -271,7 +307,7 @@ def _parse_session_start(raw: dict, session_id: str) -> EchoEvent:
     """Map a ``SessionStart`` hook payload to ``EventType.SESSION_START``."""
     logger.debug("SessionStart: session_id=%s", session_id)
 
-    return EchoEvent(
+    return _build_event(
         type=EventType.SESSION_START,
         session_id=session_id,
         source="hook",
@@ -282,8 +318,20 @@ def _parse_session_end(raw: dict, session_id: str) -> EchoEvent:
     """Map a ``SessionEnd`` hook payload to ``EventType.SESSION_END``."""
     logger.debug("SessionEnd: session_id=%s", session_id)
 
-    return EchoEvent(
+    return _build_event(
         type=EventType.SESSION_END,
         session_id=session_id,
         source="hook",
     )
+
+
+# Claude Code hook event names we handle, mapped to their parsers.
+# Defined after the parsers it references.
+_PARSERS: dict[str, Callable[[dict, str], EchoEvent]] = {
+    "PostToolUse": _parse_post_tool_use,
+    "Notification": _parse_notification,
+    "PermissionRequest": _parse_permission_request,
+    "Stop": _parse_stop,
+    "SessionStart": _parse_session_start,
+    "SessionEnd": _parse_session_end,
+}
@@ -306,9 +306,9 @@ class _TranscriptFileHandler(FileSystemEventHandler):
         )
 
         logger.debug(
-            "Emitting AGENT_MESSAGE from transcript: session=%s text=%s",
+            "Emitting AGENT_MESSAGE from transcript: session=%s text=%.120s",
             session_id,
-            text[:120] if len(text) > 120 else text,
+            text,
         )
 
         # Schedule the async emit on the event loop from this background thread.
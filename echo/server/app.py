@@ -23,21 +23,6 @@ from echo.tts.tts_engine import TTSEngine
 
 logger = logging.getLogger(__name__)
 
-# Module-level singletons shared across the process.
-event_bus: EventBus = EventBus()
-narration_bus: EventBus[NarrationEvent] = EventBus()
-response_bus: EventBus[ResponseEvent] = EventBus()
-transcript_watcher = TranscriptWatcher(event_bus=event_bus)
-summarizer = Summarizer(event_bus=event_bus, narration_bus=narration_bus)
-tts_engine = TTSEngine(narration_bus=narration_bus, event_bus=event_bus)
-stt_engine = STTEngine(
-    event_bus=event_bus,
-    narration_bus=narration_bus,
-    response_bus=response_bus,
-    alert_manager=tts_engine._alert_manager,
-    tts_engine=tts_engine,
-)
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -49,6 +34,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     narrations, spoken aloud, and (when blocked) listened for voice
     responses.  On shutdown all are stopped cleanly in reverse order.
     """
+    state = app.state
+    transcript_watcher = state.transcript_watcher
+    summarizer = state.summarizer
+    tts_engine = state.tts_engine
+    stt_engine = state.stt_engine
+
     logger.info("Echo server starting up")
     await transcript_watcher.start()
     logger.info("Transcript watcher started")
@@ -75,10 +66,15 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 def create_app() -> FastAPI:
     """Build and return a fully-configured FastAPI application.
 
+    The buses and background services are constructed here rather than
+    at import time, so importing :mod:`echo.server` stays cheap and each
+    app owns its own instances.
+
     The returned app has:
     * ``app.state.event_bus`` — the shared :class:`EventBus` instance
     * ``app.state.narration_bus`` — the shared NarrationEvent bus
     * ``app.state.response_bus`` — the shared ResponseEvent bus
+    * ``app.state.transcript_watcher`` — the :class:`TranscriptWatcher`
     * ``app.state.summarizer`` — the :class:`Summarizer` instance
     * ``app.state.tts_engine`` — the :class:`TTSEngine` instance
     * ``app.state.stt_engine`` — the :class:`STTEngine` instance
@@ -92,11 +88,26 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # Attach shared instances to app state so route handlers can access
-    # them via ``request.app.state.*``.
+    event_bus: EventBus = EventBus()
+    narration_bus: EventBus[NarrationEvent] = EventBus()
+    response_bus: EventBus[ResponseEvent] = EventBus()
+    transcript_watcher = TranscriptWatcher(event_bus=event_bus)
+    summarizer = Summarizer(event_bus=event_bus, narration_bus=narration_bus)
+    tts_engine = TTSEngine(narration_bus=narration_bus, event_bus=event_bus)
+    stt_engine = STTEngine(
+        event_bus=event_bus,
+        narration_bus=narration_bus,
+        response_bus=response_bus,
+        alert_manager=tts_engine._alert_manager,
+        tts_engine=tts_engine,
+    )
+
+    # Attach shared instances to app state so route handlers and the
+    # lifespan can access them via ``app.state.*``.
     app.state.event_bus = event_bus
     app.state.narration_bus = narration_bus
     app.state.response_bus = response_bus
+    app.state.transcript_watcher = transcript_watcher
     app.state.summarizer = summarizer
     app.state.tts_engine = tts_engine
     app.state.stt_engine = stt_engine
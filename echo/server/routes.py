@@ -10,7 +10,8 @@ POST /respond     Manual text response override -- bypass STT, dispatch
                   directly to the agent.
 
 GET  /health      Returns server health status, version, subscriber counts,
-                  Ollama availability, TTS and STT state.
+                  dropped-event counts, Ollama availability, TTS and STT
+                  state.
 
 GET  /events      Streams all events in real time as Server-Sent Events (SSE).
                   Intended for debugging and for future front-end consumers.
@@ -24,17 +25,60 @@ GET  /responses   Streams ResponseEvents as Server-Sent Events (SSE).
 
 import asyncio
 import logging
-from fastapi import APIRouter, Request
-from sse_starlette.sse import EventSourceResponse
+from typing import Any, Callable
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Request, Response
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 
 from echo import __version__
 from echo.events.event_bus import EventBus
+from echo.events.types import EchoEvent
 from echo.interceptors.hook_handler import parse_hook_event
+from echo.summarizer.types import NarrationEvent
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Keep-alive interval for SSE streams.  EventSourceResponse sends the ping
+# comments from its own task and cancels the generator when the client
+# disconnects, so the generators just block on their queue.
+_SSE_PING_INTERVAL: float = 15.0
+
+# Maximum number of already-queued messages folded into one SSE write.
+_SSE_BATCH_MAX = 32
+
+
+def _json_response(payload: dict) -> Response:
+    """Serialise *payload* with orjson, bypassing FastAPI's jsonable_encoder."""
+    return Response(orjson.dumps(payload), media_type="application/json")
+
+
+def _drain_frames(
+    queue: asyncio.Queue, first: Any, encode: Callable[[Any], bytes]
+) -> bytes:
+    """Encode *first* plus up to ``_SSE_BATCH_MAX`` queued items as one chunk.
+
+    Messages that piled up while the client was being written to go out
+    in a single ASGI send instead of one send and one loop turn each.
+    """
+    frames = [encode(first)]
+    for _ in range(_SSE_BATCH_MAX):
+        try:
+            item = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        frames.append(encode(item))
+    return b"".join(frames)
+
+
+def _response_frame(response_event) -> bytes:
+    """Encode a ResponseEvent as an SSE message for ``/responses``."""
+    return ServerSentEvent(
+        event="response", data=response_event.model_dump_json()
+    ).encode()
+
 
 def _get_event_bus(request: Request) -> EventBus:
     """Retrieve the shared EventBus from application state."""
@@ -67,7 +111,7 @@ def _get_response_bus(request: Request) -> EventBus | None:
 
 
 @router.post("/event")
-async def receive_event(request: Request) -> dict:
+async def receive_event(request: Request) -> Response:
     """Receive a hook payload from Claude Code and emit it on the event bus.
 
     The request body is raw JSON (not Pydantic-validated) because the hook
@@ -77,10 +121,12 @@ async def receive_event(request: Request) -> dict:
     event_bus = _get_event_bus(request)
 
     try:
-        raw_json: dict = await request.json()
+        raw_json = orjson.loads(await request.body())
     except Exception:
+        raw_json = None
+    if not isinstance(raw_json, dict):
         logger.warning("Failed to decode JSON body from hook POST")
-        return {"status": "error", "reason": "invalid json"}
+        return _json_response({"status": "error", "reason": "invalid json"})
 
     hook_event_name = raw_json.get("hook_event_name", "<unknown>")
     logger.info(
@@ -94,10 +140,10 @@ async def receive_event(request: Request) -> dict:
     if event is not None:
         await event_bus.emit(event)
         logger.info("Emitted %s event to bus", event.type.value)
-        return {"status": "ok", "event_type": event.type.value}
+        return _json_response({"status": "ok", "event_type": event.type.value})
 
     logger.warning("Unrecognized or malformed hook event: %s", hook_event_name)
-    return {"status": "ignored", "reason": "unrecognized event"}
+    return _json_response({"status": "ignored", "reason": "unrecognized event"})
 
 
 # ---------------------------------------------------------------------------
@@ -106,7 +152,7 @@ async def receive_event(request: Request) -> dict:
 
 
 @router.get("/health")
-async def health(request: Request) -> dict:
+async def health(request: Request) -> Response:
     """Return server health information.
 
     Useful for the CLI ``status`` command and for external monitoring.
@@ -122,6 +168,8 @@ async def health(request: Request) -> dict:
         "version": __version__,
         "subscribers": event_bus.subscriber_count,
         "narration_subscribers": narration_bus.subscriber_count,
+        "dropped_events": event_bus.dropped_count,
+        "narration_dropped_events": narration_bus.dropped_count,
         "ollama_available": summarizer.llm_available,
         "tts_state": tts_engine.state.value,
         "tts_available": tts_engine.tts_available,
@@ -138,7 +186,7 @@ async def health(request: Request) -> dict:
         result["dispatch_available"] = stt_engine.dispatch_available
         result["stt_listening"] = stt_engine.is_listening
 
-    return result
+    return _json_response(result)
 
 
 # ---------------------------------------------------------------------------
@@ -160,35 +208,19 @@ async def event_stream(request: Request) -> EventSourceResponse:
     event_bus = _get_event_bus(request)
 
     async def _generate():
-        """Async generator that yields SSE-formatted event dicts."""
-        queue = await event_bus.subscribe()
+        """Async generator that yields encoded SSE messages."""
+        queue = await event_bus.subscribe(drop_oldest=True)
         try:
             while True:
-                # Check for client disconnect before blocking on the queue.
-                if await request.is_disconnected():
-                    logger.debug("SSE client disconnected")
-                    break
-
-                try:
-                    event = await asyncio.wait_for(queue.get(), timeout=15.0)
-                except asyncio.TimeoutError:
-                    # Send a keep-alive comment to prevent proxy/client
-                    # timeouts.  EventSourceResponse handles this as a
-                    # comment line (": ping\n\n").
-                    yield {"comment": "ping"}
-                    continue
-
-                yield {
-                    "event": event.type.value,
-                    "data": event.model_dump_json(),
-                }
+                event = await queue.get()
+                yield _drain_frames(queue, event, EchoEvent.sse_frame)
         except asyncio.CancelledError:
             logger.debug("SSE stream cancelled")
         finally:
             await event_bus.unsubscribe(queue)
             logger.debug("SSE subscriber cleaned up")
 
-    return EventSourceResponse(_generate())
+    return EventSourceResponse(_generate(), ping=_SSE_PING_INTERVAL)
 
 
 # ---------------------------------------------------------------------------
@@ -210,28 +242,18 @@ async def narration_stream(request: Request) -> EventSourceResponse:
     narration_bus = _get_narration_bus(request)
 
     async def _generate():
-        queue = await narration_bus.subscribe()
+        queue = await narration_bus.subscribe(drop_oldest=True)
         try:
             while True:
-                if await request.is_disconnected():
-                    logger.debug("Narration SSE client disconnected")
-                    break
-                try:
-                    narration = await asyncio.wait_for(queue.get(), timeout=15.0)
-                except asyncio.TimeoutError:
-                    yield {"comment": "ping"}
-                    continue
-                yield {
-                    "event": narration.source_event_type.value,
-                    "data": narration.model_dump_json(),
-                }
+                narration = await queue.get()
+                yield _drain_frames(queue, narration, NarrationEvent.sse_frame)
         except asyncio.CancelledError:
             logger.debug("Narration SSE stream cancelled")
         finally:
             await narration_bus.unsubscribe(queue)
             logger.debug("Narration SSE subscriber cleaned up")
 
-    return EventSourceResponse(_generate())
+    return EventSourceResponse(_generate(), ping=_SSE_PING_INTERVAL)
 
 
 # ---------------------------------------------------------------------------
@@ -253,8 +275,10 @@ async def manual_respond(request: Request) -> dict:
         return {"status": "error", "reason": "stt engine not available"}
 
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
     except Exception:
+        body = None
+    if not isinstance(body, dict):
         return {"status": "error", "reason": "invalid json"}
 
     session_id = body.get("session_id", "")
@@ -290,29 +314,18 @@ async def response_stream(request: Request) -> EventSourceResponse:
         if response_bus is None:
             return
 
-        queue = await response_bus.subscribe()
+        queue = await response_bus.subscribe(drop_oldest=True)
         try:
             while True:
-                if await request.is_disconnected():
-                    break
-                try:
-                    response_event = await asyncio.wait_for(
-                        queue.get(), timeout=15.0
-                    )
-                except asyncio.TimeoutError:
-                    yield {"comment": "ping"}
-                    continue
-                yield {
-                    "event": "response",
-                    "data": response_event.model_dump_json(),
-                }
+                response_event = await queue.get()
+                yield _drain_frames(queue, response_event, _response_frame)
         except asyncio.CancelledError:
             logger.debug("Response SSE stream cancelled")
         finally:
             await response_bus.unsubscribe(queue)
             logger.debug("Response SSE subscriber cleaned up")
 
-    return EventSourceResponse(_generate())
+    return EventSourceResponse(_generate(), ping=_SSE_PING_INTERVAL)
 
 
 # ---------------------------------------------------------------------------
@@ -321,10 +334,13 @@ async def response_stream(request: Request) -> EventSourceResponse:
 
 
 @router.get("/test-tts")
-async def test_tts(request: Request) -> dict:
+async def test_tts(request: Request, background_tasks: BackgroundTasks) -> dict:
     """Diagnostic endpoint: synthesize a short phrase and play it.
 
     Returns details about each step so we can pinpoint TTS failures.
+    Playback is queued as a background task after the response is sent,
+    so the request is not held open for the length of the clip; playback
+    errors are logged.
     """
     tts_engine = _get_tts_engine(request)
     result: dict = {
@@ -353,15 +369,23 @@ async def test_tts(request: Request) -> dict:
         result["error"] = "Synthesis returned empty PCM data"
         return result
 
+    # ``played`` is kept for existing clients; it now means playback was
+    # queued, since the clip plays after the response is sent.
     if tts_engine.audio_available:
-        try:
-            await tts_engine._player.play_immediate(pcm)
-            result["played"] = True
-        except Exception as exc:
-            result["played"] = False
-            result["play_error"] = str(exc)
+        background_tasks.add_task(_play_test_pcm, tts_engine, pcm)
+        result["played"] = True
+        result["playback_queued"] = True
     else:
         result["played"] = False
+        result["playback_queued"] = False
         result["play_error"] = "No audio output device"
 
     return result
+
+
+async def _play_test_pcm(tts_engine, pcm: bytes) -> None:
+    """Play the ``/test-tts`` clip, logging instead of raising on failure."""
+    try:
+        await tts_engine._player.play_immediate(pcm)
+    except Exception:
+        logger.warning("Test TTS playback failed", exc_info=True)
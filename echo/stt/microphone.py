@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import math
 
 import numpy as np
 import sounddevice as sd
@@ -119,11 +120,20 @@ class MicrophoneCapture:
         3. If no speech: return None
         4. Record audio frames into buffer
         5. Monitor for silence (RMS < threshold for silence_duration seconds)
-        6. Stop recording, return concatenated PCM bytes
+        6. Stop recording, return the recorded PCM bytes
+
+        Samples are written into a buffer preallocated for max_duration
+        (plus slack for float drift in the elapsed-time counter), so
+        recording never copies chunks into a list or concatenates them.
         """
-        frames: list[np.ndarray] = []
         chunk_duration = 0.1  # 100ms chunks
         chunk_samples = int(sample_rate * chunk_duration)
+        capacity = (math.ceil(max_duration / chunk_duration) + 2) * chunk_samples
+        # Compare mean squares in raw int16 units so no chunk needs a sqrt
+        # or rescale: rms > t  <=>  mean_square > (t * 32768) ** 2.
+        threshold_ms = (silence_threshold * 32768.0) ** 2
+        buffer = np.empty(capacity, dtype=np.int16)
+        recorded = 0
         speech_started = False
         silence_elapsed = 0.0
         total_elapsed = 0.0
@@ -143,12 +153,13 @@ class MicrophoneCapture:
                         return None
 
                     data, overflowed = stream.read(chunk_samples)
-                    rms = self._compute_rms(data)
                     wait_elapsed += chunk_duration
 
-                    if rms > silence_threshold:
+                    if self._mean_square(data) > threshold_ms:
                         speech_started = True
-                        frames.append(data.copy())
+                        samples = data.reshape(-1)
+                        buffer[: len(samples)] = samples
+                        recorded = len(samples)
                         total_elapsed += chunk_duration
                         break
 
@@ -162,11 +173,15 @@ class MicrophoneCapture:
                         break
 
                     data, overflowed = stream.read(chunk_samples)
-                    frames.append(data.copy())
+                    samples = data.reshape(-1)
+                    end = recorded + len(samples)
+                    if end > capacity:
+                        break
+                    buffer[recorded:end] = samples
+                    recorded = end
                     total_elapsed += chunk_duration
 
-                    rms = self._compute_rms(data)
-                    if rms < silence_threshold:
+                    if self._mean_square(data) < threshold_ms:
                         silence_elapsed += chunk_duration
                         if silence_elapsed >= silence_duration:
                             break
@@ -175,17 +190,23 @@ class MicrophoneCapture:
 
         except Exception:
             logger.warning("Microphone stream error", exc_info=True)
-            if not frames:
+            if not recorded:
                 return None
 
-        if not frames:
+        if not recorded:
             return None
 
-        audio = np.concatenate(frames)
-        return audio.tobytes()
+        return buffer[:recorded].tobytes()
 
     @staticmethod
-    def _compute_rms(data: np.ndarray) -> float:
-        """Compute RMS amplitude of int16 audio data, normalized to 0.0-1.0."""
-        float_data = data.astype(np.float32) / 32768.0
-        return float(np.sqrt(np.mean(float_data ** 2)))
+    def _mean_square(data: np.ndarray) -> float:
+        """Return the mean squared sample value of int16 audio, in int16 units.
+
+        The sum of squares is a single dot product over int64 samples, which
+        holds a full chunk of full-scale squares exactly (int32 would
+        overflow), so no squared temporary is built.
+        """
+        samples = data.ravel().astype(np.int64)
+        if samples.size == 0:
+            return 0.0
+        return float(np.dot(samples, samples)) / samples.size
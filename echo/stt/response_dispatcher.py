@@ -5,11 +5,38 @@ import logging
 import os
 import shutil
 import sys
+import tempfile
 
-from echo.config import DISPATCH_METHOD
+from echo.config import DISPATCH_METHOD, DISPATCH_PASTE_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+# AppleScripts used for macOS dispatch.  The response text arrives as the
+# first ``argv`` item, so the sources never change and need no escaping.
+# "type" synthesises one key event per character; "paste" puts the text on
+# the clipboard and sends a single cmd+v, which is much faster for long text.
+_APPLESCRIPT_SOURCES: dict[str, str] = {
+    "type": (
+        'on run argv\n'
+        '    tell application "System Events"\n'
+        '        keystroke (item 1 of argv)\n'
+        '        delay 0.1\n'
+        '        keystroke return\n'
+        '    end tell\n'
+        'end run'
+    ),
+    "paste": (
+        'on run argv\n'
+        '    set the clipboard to (item 1 of argv)\n'
+        '    tell application "System Events"\n'
+        '        keystroke "v" using command down\n'
+        '        delay 0.1\n'
+        '        keystroke return\n'
+        '    end tell\n'
+        'end run'
+    ),
+}
+
 
 class ResponseDispatcher:
     """Injects response text into the Claude Code terminal.
@@ -23,6 +50,7 @@ class ResponseDispatcher:
     def __init__(self) -> None:
         self._available: bool = False
         self._method: str | None = None
+        self._compiled_scripts: dict[str, str] = {}
 
     async def start(self) -> None:
         """Detect platform and available injection methods."""
@@ -30,19 +58,27 @@ class ResponseDispatcher:
             self._method = DISPATCH_METHOD
             self._available = True
             logger.info("Response dispatch method forced: %s", DISPATCH_METHOD)
-            return
-
-        self._method = self._detect_method()
-        self._available = self._method is not None
-        if self._available:
-            logger.info("Response dispatch method detected: %s", self._method)
         else:
-            logger.warning("No response dispatch method available")
+            self._method = self._detect_method()
+            self._available = self._method is not None
+            if self._available:
+                logger.info("Response dispatch method detected: %s", self._method)
+            else:
+                logger.warning("No response dispatch method available")
+
+        if self._method == "applescript":
+            await self._compile_applescripts()
 
     async def stop(self) -> None:
         """Release resources."""
         self._available = False
         self._method = None
+        for path in self._compiled_scripts.values():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._compiled_scripts.clear()
 
     @property
     def is_available(self) -> bool:
@@ -88,18 +124,61 @@ class ResponseDispatcher:
             return False
         return True
 
+    async def _compile_applescripts(self) -> None:
+        """Compile the dispatch scripts once with osacompile.
+
+        Running a compiled ``.scpt`` skips osascript's per-call parse and
+        compile.  Any script that fails to compile falls back to its inline
+        source at dispatch time.
+        """
+        if not shutil.which("osacompile"):
+            return
+        for name, source in _APPLESCRIPT_SOURCES.items():
+            if name == "paste" and DISPATCH_PASTE_THRESHOLD <= 0:
+                continue
+            fd, path = tempfile.mkstemp(prefix=f"echo-{name}-", suffix=".scpt")
+            os.close(fd)
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "osacompile", "-o", path, "-e", source,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                stdout, stderr = await proc.communicate()
+            except Exception:
+                logger.warning(
+                    "osacompile failed — using inline AppleScript", exc_info=True
+                )
+                os.unlink(path)
+                continue
+            if proc.returncode != 0:
+                logger.warning(
+                    "osacompile failed — using inline AppleScript: %s",
+                    stderr.decode(),
+                )
+                os.unlink(path)
+                continue
+            self._compiled_scripts[name] = path
+
     async def _dispatch_applescript(self, text: str) -> bool:
-        """macOS: Use osascript to send keystrokes to Terminal/iTerm2."""
-        escaped = text.replace("\\", "\\\\").replace('"', '\\"')
-        script = (
-            'tell application "System Events"\n'
-            f'    keystroke "{escaped}"\n'
-            '    delay 0.1\n'
-            '    keystroke return\n'
-            'end tell'
-        )
+        """macOS: Use osascript to send keystrokes to Terminal/iTerm2.
+
+        The text is passed as a script argument rather than spliced into
+        the source, so a precompiled script can be reused for every call.
+        Text longer than ``DISPATCH_PASTE_THRESHOLD`` (when set) is pasted
+        through the clipboard instead of typed key by key.
+        """
+        if 0 < DISPATCH_PASTE_THRESHOLD < len(text):
+            name = "paste"
+        else:
+            name = "type"
+        compiled = self._compiled_scripts.get(name)
+        if compiled is not None:
+            args = ("osascript", compiled, text)
+        else:
+            args = ("osascript", "-e", _APPLESCRIPT_SOURCES[name], text)
         proc = await asyncio.create_subprocess_exec(
-            "osascript", "-e", script,
+            *args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -110,9 +189,13 @@ class ResponseDispatcher:
         return True
 
     async def _dispatch_xdotool(self, text: str) -> bool:
-        """Linux X11: Use xdotool to type text."""
+        """Linux X11: Use xdotool to type text.
+
+        The trailing newline is typed as Return, so text and Enter go out in
+        a single xdotool process.
+        """
         proc = await asyncio.create_subprocess_exec(
-            "xdotool", "type", "--clearmodifiers", text,
+            "xdotool", "type", "--clearmodifiers", "--", text + "\n",
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -120,14 +203,7 @@ class ResponseDispatcher:
         if proc.returncode != 0:
             logger.warning("xdotool type failed: %s", stderr.decode())
             return False
-
-        proc2 = await asyncio.create_subprocess_exec(
-            "xdotool", "key", "Return",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await proc2.communicate()
-        return proc2.returncode == 0
+        return True
 
     @staticmethod
     def _detect_method() -> str | None:
@@ -1,13 +1,15 @@
 """Maps spoken transcript text to the best matching option from a list.
 
 Uses a priority chain of matching strategies: ordinal, yes/no shortcut,
-direct substring, fuzzy (SequenceMatcher), and verbatim fallback.
+direct substring, fuzzy (RapidFuzz ratio), and verbatim fallback.
 """
 
 from __future__ import annotations
 
 import logging
-from difflib import SequenceMatcher
+import re
+
+from rapidfuzz import fuzz, process
 
 from echo.config import STT_CONFIDENCE_THRESHOLD
 from echo.events.types import BlockReason
@@ -32,20 +34,26 @@ _ORDINAL_WORDS: dict[str, int] = {
     "ten": 9, "tenth": 9, "10": 9,
 }
 
-# Prefix words to strip before ordinal lookup.
-_ORDINAL_STRIP_WORDS = {"option", "the", "number", "pick"}
+# Any whole ordinal word, longest alternatives first.  Filler such as
+# "option", "the", "number" or "pick" never matches, and trailing
+# punctuation ("option one.") does not hide the word.
+_ORDINAL_RE = re.compile(
+    r"\b("
+    + "|".join(map(re.escape, sorted(_ORDINAL_WORDS, key=len, reverse=True)))
+    + r")\b"
+)
 
 # ---------------------------------------------------------------------------
 # Yes/No word sets
 # ---------------------------------------------------------------------------
 
-_YES_WORDS: set[str] = {
+_YES_WORDS: frozenset[str] = frozenset({
     "yes", "yeah", "yep", "yup", "sure", "allow", "approve", "accept", "ok", "okay",
-}
+})
 
-_NO_WORDS: set[str] = {
+_NO_WORDS: frozenset[str] = frozenset({
     "no", "nah", "nope", "deny", "reject", "decline", "refuse", "block",
-}
+})
 
 
 class ResponseMatcher:
@@ -63,34 +71,42 @@ class ResponseMatcher:
         1. Ordinal: "option one", "first one", "one", "1" -> options[0]
         2. Yes/No shortcut: "yes"/"no" for 2-option permission prompts
         3. Direct: transcript contains option text (case-insensitive)
-        4. Fuzzy: SequenceMatcher similarity above threshold
+        4. Fuzzy: RapidFuzz similarity ratio above threshold
         5. Verbatim: no options available, return transcript as-is
         """
+        stripped = transcript.strip()
         if not options:
             return MatchResult(
-                matched_text=transcript.strip(),
+                matched_text=stripped,
                 confidence=1.0,
                 method=MatchMethod.VERBATIM,
             )
 
-        result = self._try_ordinal_match(transcript, options)
+        # Lowercase once here; every strategy compares case-insensitively.
+        transcript_lower = stripped.lower()
+
+        result = self._try_ordinal_match(transcript_lower, options)
         if result is not None:
             return result
 
-        result = self._try_yes_no_match(transcript, options, block_reason)
+        result = self._try_yes_no_match(transcript_lower, options, block_reason)
         if result is not None:
             return result
 
-        result = self._try_direct_match(transcript, options)
+        # Only the text-comparison strategies need the options lowercased,
+        # so the common "yes" / "option two" answers never build this list.
+        options_lower = [option.lower() for option in options]
+
+        result = self._try_direct_match(transcript_lower, options, options_lower)
         if result is not None:
             return result
 
-        result = self._try_fuzzy_match(transcript, options)
+        result = self._try_fuzzy_match(transcript_lower, options, options_lower)
         if result is not None:
             return result
 
         return MatchResult(
-            matched_text=transcript.strip(),
+            matched_text=stripped,
             confidence=1.0,
             method=MatchMethod.VERBATIM,
         )
@@ -100,18 +116,12 @@ class ResponseMatcher:
     # --------------------------------------------------------------------- #
 
     def _try_ordinal_match(
-        self, transcript: str, options: list[str]
+        self, transcript_lower: str, options: list[str]
     ) -> MatchResult | None:
-        words = transcript.lower().split()
-        # Strip known prefix words.
-        filtered = [w for w in words if w not in _ORDINAL_STRIP_WORDS]
-        if not filtered:
-            return None
-
-        # Check each remaining word against the ordinal lookup.
-        for word in filtered:
-            index = _ORDINAL_WORDS.get(word)
-            if index is not None and index < len(options):
+        # The first ordinal that names an existing option wins.
+        for m in _ORDINAL_RE.finditer(transcript_lower):
+            index = _ORDINAL_WORDS[m.group(1)]
+            if index < len(options):
                 return MatchResult(
                     matched_text=options[index],
                     confidence=0.95,
@@ -126,7 +136,7 @@ class ResponseMatcher:
 
     def _try_yes_no_match(
         self,
-        transcript: str,
+        transcript_lower: str,
         options: list[str],
         block_reason: BlockReason | None,
     ) -> MatchResult | None:
@@ -135,16 +145,15 @@ class ResponseMatcher:
         if block_reason != BlockReason.PERMISSION_PROMPT:
             return None
 
-        normalized = transcript.strip().lower()
-        words = set(normalized.split())
+        words = transcript_lower.split()
 
-        if words & _YES_WORDS:
+        if any(word in _YES_WORDS for word in words):
             return MatchResult(
                 matched_text=options[0],
                 confidence=0.9,
                 method=MatchMethod.YES_NO,
             )
-        if words & _NO_WORDS:
+        if any(word in _NO_WORDS for word in words):
             return MatchResult(
                 matched_text=options[1],
                 confidence=0.9,
@@ -158,13 +167,11 @@ class ResponseMatcher:
     # --------------------------------------------------------------------- #
 
     def _try_direct_match(
-        self, transcript: str, options: list[str]
+        self, transcript_lower: str, options: list[str], options_lower: list[str]
     ) -> MatchResult | None:
-        transcript_lower = transcript.lower()
         matches: list[str] = []
 
-        for option in options:
-            option_lower = option.lower()
+        for option, option_lower in zip(options, options_lower):
             if option_lower in transcript_lower or transcript_lower in option_lower:
                 matches.append(option)
 
@@ -180,29 +187,27 @@ class ResponseMatcher:
         )
 
     # --------------------------------------------------------------------- #
-    # Fuzzy matching (SequenceMatcher)
+    # Fuzzy matching (RapidFuzz)
     # --------------------------------------------------------------------- #
 
     def _try_fuzzy_match(
-        self, transcript: str, options: list[str]
+        self, transcript_lower: str, options: list[str], options_lower: list[str]
     ) -> MatchResult | None:
-        transcript_lower = transcript.lower()
-        best_ratio = 0.0
-        best_option: str | None = None
-
-        for option in options:
-            ratio = SequenceMatcher(
-                None, transcript_lower, option.lower()
-            ).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_option = option
-
-        if best_option is not None and best_ratio >= STT_CONFIDENCE_THRESHOLD:
-            return MatchResult(
-                matched_text=best_option,
-                confidence=best_ratio,
-                method=MatchMethod.FUZZY,
-            )
+        # fuzz.ratio is the normalised Indel similarity (0-100), the same
+        # 2*M/T measure SequenceMatcher.ratio() approximates.  score_cutoff
+        # lets RapidFuzz skip options that cannot reach the threshold.
+        best = process.extractOne(
+            transcript_lower,
+            options_lower,
+            scorer=fuzz.ratio,
+            score_cutoff=STT_CONFIDENCE_THRESHOLD * 100,
+        )
+        if best is None:
+            return None
 
-        return None
+        _, score, index = best
+        return MatchResult(
+            matched_text=options[index],
+            confidence=score / 100,
+            method=MatchMethod.FUZZY,
+        )
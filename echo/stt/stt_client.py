@@ -7,8 +7,9 @@ is missing, following the same lifecycle pattern as ElevenLabsClient.
 
 import io
 import logging
+import struct
 import time
-import wave
+from urllib.parse import quote
 
 import httpx
 
@@ -38,10 +39,19 @@ class STTClient:
             logger.info("No STT API key — STT disabled")
             return
 
+        # Uploads arrive minutes apart (one per blocked prompt), so keep the
+        # idle connection well past httpx's 5s default to skip a fresh TLS
+        # handshake, and retry a failed connect once before giving up.
         self._client = httpx.AsyncClient(
             base_url=STT_BASE_URL,
             timeout=STT_TIMEOUT,
             headers={"Authorization": f"Bearer {STT_API_KEY}"},
+            # httpx ignores the client's ``limits=`` when a transport is
+            # given, so the pool limits go on the transport itself.
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+            ),
         )
         await self._check_health()
 
@@ -86,13 +96,20 @@ class STTClient:
             return None
 
     async def _check_health(self) -> None:
-        """Validate API key via GET /v1/models."""
+        """Validate the API key and model via GET /v1/models/{STT_MODEL}.
+
+        Looking up the one configured model returns a small object instead
+        of the full model list.  Self-hosted OpenAI-compatible servers that only implement the list
+        endpoint answer 404/405 there, so those fall back to GET /v1/models.
+        """
         self._last_health_check = time.monotonic()
         if not self._client:
             self._available = False
             return
         try:
-            resp = await self._client.get("/v1/models")
+            resp = await self._client.get(f"/v1/models/{quote(STT_MODEL, safe='')}")
+            if resp.status_code in (404, 405):
+                resp = await self._client.get("/v1/models")
             if resp.status_code == 200:
                 self._available = True
                 logger.info(
@@ -123,12 +140,15 @@ class STTClient:
 
     @staticmethod
     def _wrap_wav(pcm_bytes: bytes, sample_rate: int = 16000) -> io.BytesIO:
-        """Wrap raw PCM int16 bytes in a WAV header."""
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(sample_rate)
-            wf.writeframes(pcm_bytes)
-        buf.seek(0)
-        return buf
+        """Wrap raw PCM int16 bytes in a WAV header.
+
+        The 44-byte mono 16-bit header is packed directly, so the PCM is
+        copied once (header + data) and the BytesIO shares that buffer.
+        """
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + len(pcm_bytes), b"WAVE",
+            b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b"data", len(pcm_bytes),
+        )
+        return io.BytesIO(header + pcm_bytes)
@@ -8,6 +8,7 @@ alert is resolved externally.
 
 import asyncio
 import logging
+from collections import OrderedDict
 
 from echo.config import STT_CONFIDENCE_THRESHOLD
 from echo.events.event_bus import EventBus
@@ -22,9 +23,13 @@ logger = logging.getLogger(__name__)
 
 # Maximum time to wait for TTS to finish playing before starting capture.
 _TTS_WAIT_TIMEOUT: float = 20.0
-_TTS_WAIT_POLL: float = 0.2
-# Initial delay to let the pipeline propagate (EventBus → Summarizer → NarrationBus → TTS).
+# Maximum time to wait for TTS to start playing this event's alert.
+_TTS_START_TIMEOUT: float = 2.0
+# Fixed delay to let the pipeline propagate (EventBus → Summarizer →
+# NarrationBus → TTS) when the event cannot be tracked to the TTS engine.
 _TTS_WAIT_INITIAL: float = 0.5
+# Number of synthesized "Sending: ..." confirmations kept for reuse.
+_CONFIRM_PCM_CACHE_SIZE = 32
 
 
 class STTEngine:
@@ -55,6 +60,7 @@ class STTEngine:
         self._listen_task: asyncio.Task | None = None
         self._running: bool = False
         self._current_session: str | None = None
+        self._confirm_pcm_cache: OrderedDict[str, bytes] = OrderedDict()
 
     async def start(self) -> None:
         """Start sub-components, subscribe to event bus, begin consume loop."""
@@ -96,10 +102,17 @@ class STTEngine:
             await self._event_bus.unsubscribe(self._queue)
             self._queue = None
 
-        # Stop sub-components in reverse order
-        await self._dispatcher.stop()
-        await self._stt_client.stop()
-        await self._microphone.stop()
+        # Sub-components share no state, so stop them concurrently; a slow
+        # HTTP client close no longer delays microphone teardown.
+        results = await asyncio.gather(
+            self._dispatcher.stop(),
+            self._stt_client.stop(),
+            self._microphone.stop(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("STT sub-component failed to stop", exc_info=result)
 
         self._current_session = None
         logger.info("STT engine stopped")
@@ -143,20 +156,24 @@ class STTEngine:
 
     async def _consume_loop(self) -> None:
         """Listen to EventBus for agent_blocked events with options."""
+        # stop() cancels this task, which interrupts queue.get() directly,
+        # so there is no need to wake up periodically to check _running.
         while self._running:
             try:
-                event: EchoEvent = await asyncio.wait_for(
-                    self._queue.get(), timeout=1.0
-                )
-            except asyncio.TimeoutError:
-                continue
+                event: EchoEvent | None = await self._queue.get()
             except asyncio.CancelledError:
                 break
 
-            try:
-                await self._handle_event(event)
-            except Exception:
-                logger.warning("STTEngine error processing event", exc_info=True)
+            # Handle everything already queued before blocking again.
+            while event is not None:
+                try:
+                    await self._handle_event(event)
+                except Exception:
+                    logger.warning("STTEngine error processing event", exc_info=True)
+                try:
+                    event = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    event = None
 
     async def _handle_event(self, event: EchoEvent) -> None:
         """Handle incoming events from the EventBus."""
@@ -181,36 +198,35 @@ class STTEngine:
         self._current_session = event.session_id
         self._listen_task = asyncio.create_task(
             self._listen_and_respond(
-                event.session_id, event.options, event.block_reason
+                event.session_id, event.options, event.block_reason, event.event_id
             )
         )
 
-    async def _wait_for_tts(self) -> None:
+    async def _wait_for_tts(self, source_event_id: str | None = None) -> None:
         """Wait for TTSEngine to finish playing the critical narration.
 
         The STTEngine receives events from EventBus BEFORE the TTSEngine
         receives the corresponding NarrationEvent (which goes through the
-        Summarizer first).  A short initial delay lets the pipeline
-        propagate the event to TTSEngine so ``_critical_complete`` is
-        cleared before we check it.  Then we await the Event for proper
-        synchronization instead of busy-polling a boolean flag.
+        Summarizer first).  We first wait until TTSEngine reports that
+        critical playback for *source_event_id* has started, so
+        ``_critical_complete`` is cleared before we check it; without an
+        event id to track we fall back to a short fixed delay.  Then we
+        await the Event for proper synchronization instead of busy-polling
+        a boolean flag.  An engine without ``_critical_complete`` cannot
+        signal completion, so there is nothing to wait for.
         """
         if not self._tts_engine:
             return
 
-        # Give the pipeline time: EventBus → Summarizer → NarrationBus → TTS
-        await asyncio.sleep(_TTS_WAIT_INITIAL)
+        critical_started = getattr(self._tts_engine, "_critical_started", None)
+        if source_event_id is not None and isinstance(critical_started, asyncio.Condition):
+            await self._wait_for_tts_start(critical_started, source_event_id)
+        else:
+            # Give the pipeline time: EventBus → Summarizer → NarrationBus → TTS
+            await asyncio.sleep(_TTS_WAIT_INITIAL)
 
         critical_complete = getattr(self._tts_engine, "_critical_complete", None)
         if critical_complete is None:
-            # Fallback: poll the boolean flag
-            elapsed = 0.0
-            while elapsed < _TTS_WAIT_TIMEOUT:
-                if not getattr(self._tts_engine, "_processing_critical", False):
-                    return
-                await asyncio.sleep(_TTS_WAIT_POLL)
-                elapsed += _TTS_WAIT_POLL
-            logger.warning("Timed out waiting for TTS (poll fallback)")
             return
 
         try:
@@ -218,17 +234,35 @@ class STTEngine:
         except asyncio.TimeoutError:
             logger.warning("Timed out waiting for TTS to finish critical playback")
 
+    async def _wait_for_tts_start(
+        self, critical_started: asyncio.Condition, source_event_id: str
+    ) -> None:
+        """Wait until TTSEngine starts critical playback for *source_event_id*."""
+
+        def started() -> bool:
+            return self._tts_engine._critical_source_id == source_event_id
+
+        async def wait() -> None:
+            async with critical_started:
+                await critical_started.wait_for(started)
+
+        try:
+            await asyncio.wait_for(wait(), timeout=_TTS_START_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.debug("TTS did not start critical playback for %s", source_event_id)
+
     async def _listen_and_respond(
         self,
         session_id: str,
         options: list[str] | None,
         block_reason: BlockReason | None,
+        source_event_id: str | None = None,
     ) -> None:
         """Full cycle: capture -> transcribe -> match -> confirm -> dispatch."""
         try:
             # Wait for TTS to finish playing the alert + narration before
             # opening the microphone, to avoid sounddevice conflicts.
-            await self._wait_for_tts()
+            await self._wait_for_tts(source_event_id)
 
             # Step 1: Capture audio
             if not self._microphone.is_available:
@@ -308,38 +342,81 @@ class STTEngine:
     async def _confirm_and_dispatch(
         self, match_result: MatchResult, session_id: str
     ) -> None:
-        """Narrate confirmation, then dispatch response."""
+        """Narrate confirmation while dispatching the response.
+
+        Playback (audio out) and dispatch (keystrokes) touch different
+        subsystems, so the confirmation plays in a task that overlaps the
+        dispatch and alert clear instead of delaying them.
+        """
         confirmation_text = f"Sending: {match_result.matched_text}"
+        playback: asyncio.Task | None = None
 
         # Optional: use TTS engine to confirm
         if self._tts_engine and hasattr(self._tts_engine, "_provider"):
             try:
-                pcm = await self._tts_engine._provider.synthesize(confirmation_text)
+                pcm = await self._confirmation_pcm(confirmation_text)
                 if pcm and hasattr(self._tts_engine, "_player"):
-                    await self._tts_engine._player.play_immediate(pcm)
+                    playback = asyncio.create_task(self._play_confirmation(pcm))
             except Exception:
                 logger.debug("Confirmation TTS failed — continuing with dispatch")
 
-        # Dispatch the response
-        if self._dispatcher.is_available:
-            success = await self._dispatcher.dispatch(match_result.matched_text)
-            if success:
+        # Dispatch the response.  If dispatch fails or this task is cancelled
+        # (alert resolved externally), stop the confirmation rather than
+        # leave it announcing a response that was never sent.
+        completed = False
+        try:
+            if self._dispatcher.is_available:
+                success = await self._dispatcher.dispatch(match_result.matched_text)
+                if success:
+                    logger.info(
+                        "Response dispatched for session %s: %s",
+                        session_id,
+                        match_result.matched_text,
+                    )
+                else:
+                    logger.warning("Response dispatch failed for session %s", session_id)
+            else:
                 logger.info(
-                    "Response dispatched for session %s: %s",
-                    session_id,
+                    "Dispatch unavailable — matched response: %s (please type manually)",
                     match_result.matched_text,
                 )
-            else:
-                logger.warning("Response dispatch failed for session %s", session_id)
-        else:
-            logger.info(
-                "Dispatch unavailable — matched response: %s (please type manually)",
-                match_result.matched_text,
-            )
 
-        # Clear the alert so it stops repeating
-        if self._alert_manager and hasattr(self._alert_manager, "clear_alert"):
-            await self._alert_manager.clear_alert(session_id)
+            # Clear the alert so it stops repeating
+            if self._alert_manager and hasattr(self._alert_manager, "clear_alert"):
+                await self._alert_manager.clear_alert(session_id)
+            completed = True
+        finally:
+            if playback is not None:
+                if completed:
+                    # Cancelling us while we wait here also cancels playback.
+                    await playback
+                else:
+                    playback.cancel()
+
+    async def _play_confirmation(self, pcm: bytes) -> None:
+        """Play confirmation audio, logging instead of raising on failure."""
+        try:
+            await self._tts_engine._player.play_immediate(pcm)
+        except Exception:
+            logger.debug("Confirmation playback failed", exc_info=True)
+
+    async def _confirmation_pcm(self, text: str) -> bytes | None:
+        """Return PCM for a confirmation phrase, synthesizing it on a cache miss.
+
+        Option lists repeat ("yes", "no", "1", ...), so recent confirmations
+        are kept to skip the TTS round-trip when the same reply is sent again.
+        """
+        pcm = self._confirm_pcm_cache.get(text)
+        if pcm is not None:
+            self._confirm_pcm_cache.move_to_end(text)
+            return pcm
+
+        pcm = await self._tts_engine._provider.synthesize(text)
+        if pcm:
+            self._confirm_pcm_cache[text] = pcm
+            if len(self._confirm_pcm_cache) > _CONFIRM_PCM_CACHE_SIZE:
+                self._confirm_pcm_cache.popitem(last=False)
+        return pcm
 
     async def _cancel_listening(self, session_id: str) -> None:
         """Cancel active listening for a session."""
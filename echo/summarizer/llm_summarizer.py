@@ -6,10 +6,13 @@ when Ollama is unavailable.
 """
 
 import asyncio
+import hashlib
 import logging
 import time
+from collections import OrderedDict
 
 import httpx
+import orjson
 
 from echo.config import (
     OLLAMA_BASE_URL,
@@ -36,6 +39,14 @@ _SUMMARIZATION_PROMPT = (
 _MAX_TRUNCATION_LENGTH = 1000
 _TRUNCATED_LENGTH = 990
 
+# Only the start of a long message is sent to Ollama; a one-sentence
+# summary does not need the rest, and prompt prefill grows with length.
+_MAX_PROMPT_TEXT_LENGTH = 4000
+
+# Number of recent Ollama summaries kept, keyed by a digest of the input
+# text with whitespace collapsed.
+_SUMMARY_CACHE_SIZE = 256
+
 
 class LLMSummarizer:
     """Summarizes agent_message text via Ollama LLM with truncation fallback."""
@@ -44,10 +55,17 @@ class LLMSummarizer:
         self._ollama_available: bool = False
         self._last_health_check: float = 0.0
         self._client: httpx.AsyncClient | None = None
+        self._summary_cache: OrderedDict[bytes, str] = OrderedDict()
 
     async def start(self) -> None:
         """Initialize the HTTP client and run initial health check."""
-        self._client = httpx.AsyncClient(base_url=OLLAMA_BASE_URL, timeout=OLLAMA_TIMEOUT)
+        # Agent messages arrive seconds to minutes apart, so keep the idle
+        # connection well past httpx's 5s default to avoid reconnecting.
+        self._client = httpx.AsyncClient(
+            base_url=OLLAMA_BASE_URL,
+            timeout=OLLAMA_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+        )
         await self._check_health()
 
     async def stop(self) -> None:
@@ -64,44 +82,89 @@ class LLMSummarizer:
     async def summarize(self, event: EchoEvent) -> NarrationEvent:
         """Summarize an agent_message event into a NarrationEvent.
 
-        Tries Ollama first; falls back to truncation on failure.
+        Tries Ollama first; falls back to truncation on failure.  Summaries
+        of recently seen text are reused without calling Ollama again.
         """
         text = event.text or ""
+        key = self._cache_key(text)
 
-        # Periodically re-check Ollama availability
+        summary = self._summary_cache.get(key)
+        if summary is not None:
+            self._summary_cache.move_to_end(key)
+            return self._llm_narration(event, summary)
+
+        # Re-probe Ollama periodically while it is marked unavailable
         await self._maybe_recheck_health()
 
         if self._ollama_available and self._client:
             try:
-                summary = await self._call_ollama(text)
-                return NarrationEvent(
-                    text=summary.strip(),
-                    priority=NarrationPriority.NORMAL,
-                    source_event_type=EventType.AGENT_MESSAGE,
-                    summarization_method=SummarizationMethod.LLM,
-                    session_id=event.session_id,
-                    source_event_id=event.event_id,
-                )
+                summary = (await self._call_ollama(text)).strip()
+                if self._is_usable_summary(summary):
+                    self._summary_cache[key] = summary
+                    if len(self._summary_cache) > _SUMMARY_CACHE_SIZE:
+                        self._summary_cache.popitem(last=False)
+                    return self._llm_narration(event, summary)
+                logger.warning("Ollama returned no usable summary (%r) — falling back to truncation", summary)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+                # Ollama went away: stop posting to it until the periodic
+                # health re-check finds it again.
+                self._ollama_available = False
+                self._last_health_check = time.monotonic()
+                logger.warning("Ollama not reachable — using truncation fallback: %s", exc)
             except Exception:
                 logger.warning("Ollama summarization failed — falling back to truncation", exc_info=True)
 
         # Fallback: truncation
         return self._truncate(event)
 
+    @staticmethod
+    def _is_usable_summary(summary: str) -> bool:
+        """Reject empty or label-only replies such as ``"Summary:"``.
+
+        Generation stops at the first newline, so a model that opens with a
+        label line ("Summary:\n...") yields only the label.
+        """
+        return bool(summary) and not summary.endswith(":")
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Digest *text* with whitespace collapsed, so reflowed copies share a key."""
+        normalized = " ".join(text.split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+    @staticmethod
+    def _llm_narration(event: EchoEvent, summary: str) -> NarrationEvent:
+        """Wrap an Ollama summary of *event* in a NarrationEvent."""
+        return NarrationEvent(
+            text=summary,
+            priority=NarrationPriority.NORMAL,
+            source_event_type=EventType.AGENT_MESSAGE,
+            summarization_method=SummarizationMethod.LLM,
+            session_id=event.session_id,
+            source_event_id=event.event_id,
+        )
+
     async def _call_ollama(self, text: str) -> str:
-        """Call the Ollama /api/generate endpoint."""
-        prompt = _SUMMARIZATION_PROMPT.format(text=text)
+        """Call the Ollama /api/generate endpoint.
+
+        Generation stops at the first newline: the prompt asks for one
+        sentence, and anything the model adds on later lines would be
+        decoded only to be read out or thrown away.
+        """
+        prompt = _SUMMARIZATION_PROMPT.format(text=text[:_MAX_PROMPT_TEXT_LENGTH])
+        payload = {
+            "model": OLLAMA_MODEL,
+            "prompt": prompt,
+            "stream": False,
+            "options": {"num_predict": 50, "temperature": 0.3, "stop": ["\n"]},
+        }
         response = await self._client.post(
             "/api/generate",
-            json={
-                "model": OLLAMA_MODEL,
-                "prompt": prompt,
-                "stream": False,
-                "options": {"num_predict": 50, "temperature": 0.3},
-            },
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get("response", "").strip()
 
     def _truncate(self, event: EchoEvent) -> NarrationEvent:
@@ -3,7 +3,7 @@
 import time
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from echo.events.types import BlockReason, EventType
 
@@ -42,8 +42,16 @@ class NarrationEvent(BaseModel):
     ``EchoEvent``.  Each ``NarrationEvent`` carries the final
     narration text, the priority that governs TTS scheduling, and
     traceability fields linking back to the originating event.
+
+    Like ``EchoEvent``, narrations are frozen because one instance is
+    shared by every narration-bus subscriber.
     """
 
+    model_config = ConfigDict(frozen=True)
+
+    _json_cache: str | None = PrivateAttr(default=None)
+    _sse_frame_cache: bytes | None = PrivateAttr(default=None)
+
     text: str
     priority: NarrationPriority
     source_event_type: EventType
@@ -53,3 +61,23 @@ class NarrationEvent(BaseModel):
     source_event_id: str | None = None
     block_reason: BlockReason | None = None
     options: list[str] | None = None
+
+    def json_str(self) -> str:
+        """Return the narration serialised as JSON, computed on first use."""
+        if self._json_cache is None:
+            self._json_cache = self.model_dump_json()
+        return self._json_cache
+
+    def sse_frame(self) -> bytes:
+        """Return the narration as an encoded SSE message, computed on first use.
+
+        The event name is ``source_event_type.value`` and the data line is
+        :meth:`json_str`, which never contains a newline.  Lines end in
+        ``\\r\\n`` to match ``EventSourceResponse``'s default separator.
+        """
+        if self._sse_frame_cache is None:
+            self._sse_frame_cache = (
+                f"event: {self.source_event_type.value}\r\n"
+                f"data: {self.json_str()}\r\n\r\n"
+            ).encode()
+        return self._sse_frame_cache
@@ -39,6 +39,10 @@ class TTSEngine:
         self._processing_critical: bool = False
         self._critical_complete: asyncio.Event = asyncio.Event()
         self._critical_complete.set()  # Initially: no critical work pending
+        # Notified when critical playback starts, with the source event id it
+        # is for, so STT can tell when its own alert has reached the player.
+        self._critical_started: asyncio.Condition = asyncio.Condition()
+        self._critical_source_id: str | None = None
         self._event_bus = event_bus
         self._alert_manager: AlertManager | None = None
         if event_bus is not None:
@@ -160,6 +164,9 @@ class TTSEngine:
         """CRITICAL: interrupt current playback, play reason-specific alert, synthesize, play immediately."""
         self._critical_complete.clear()
         self._processing_critical = True
+        async with self._critical_started:
+            self._critical_source_id = narration.source_event_id
+            self._critical_started.notify_all()
         try:
             await self._player.interrupt()
             await self._player.play_alert(block_reason=narration.block_reason)
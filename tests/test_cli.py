@@ -0,0 +1,308 @@
+"""Tests for echo.cli — PID file handling and server process helpers."""
+
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import click.testing
+import httpx
+import pytest
+
+from echo import cli
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def sleeper():
+    """Spawn a real child process that stays alive until killed."""
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    yield proc
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
+
+
+@pytest.fixture
+def echo_dir(tmp_path, monkeypatch):
+    """Point the CLI's state directory, PID file and log file at *tmp_path*."""
+    monkeypatch.setattr(cli, "ECHO_DIR", tmp_path)
+    monkeypatch.setattr(cli, "PID_FILE", tmp_path / "server.pid")
+    monkeypatch.setattr(cli, "_LOG_FILE", tmp_path / "server.log")
+    return tmp_path
+
+
+@pytest.fixture
+def short_socket_path(monkeypatch):
+    """Set ECHO_EVENT_SOCKET to a path short enough for AF_UNIX (~104 bytes)."""
+    tmp_dir = tempfile.TemporaryDirectory(dir="/tmp")
+    path = Path(tmp_dir.name) / "events.sock"
+    monkeypatch.setenv("ECHO_EVENT_SOCKET", str(path))
+    yield path
+    tmp_dir.cleanup()
+
+
+# ---------------------------------------------------------------------------
+# PID file
+# ---------------------------------------------------------------------------
+
+
+class TestPidFile:
+    """Tests for writing and reading the PID file."""
+
+    def test_write_then_read_round_trips(self, echo_dir):
+        cli._atomic_write_pid(4321)
+        assert cli._read_pid() == 4321
+        assert [p.name for p in echo_dir.iterdir()] == ["server.pid"]
+
+    def test_write_replaces_existing_file(self, echo_dir):
+        cli.PID_FILE.write_text("1111")
+        cli._atomic_write_pid(2222)
+        assert cli.PID_FILE.read_text() == "2222"
+
+    def test_failed_write_leaves_no_temp_file(self, echo_dir, monkeypatch):
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(cli.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            cli._atomic_write_pid(4321)
+        assert list(echo_dir.iterdir()) == []
+
+    def test_read_missing_file_returns_none(self, echo_dir):
+        assert cli._read_pid() is None
+
+    def test_read_ignores_trailing_newline(self, echo_dir):
+        cli.PID_FILE.write_text("4321\n")
+        assert cli._read_pid() == 4321
+
+    def test_read_garbage_returns_none(self, echo_dir):
+        cli.PID_FILE.write_text("not-a-pid")
+        assert cli._read_pid() is None
+
+
+# ---------------------------------------------------------------------------
+# Process liveness
+# ---------------------------------------------------------------------------
+
+
+class TestProcessLiveness:
+    """Tests for _child_is_running and _is_process_running."""
+
+    def test_running_child(self, sleeper):
+        assert cli._child_is_running(sleeper.pid) is True
+        assert cli._is_process_running(sleeper.pid) is True
+
+    def test_exited_unreaped_child_is_not_running(self, sleeper):
+        sleeper.kill()
+        assert cli._wait_for_exit(sleeper.pid, 2.0) is True
+        # The zombie still answers kill(pid, 0); waitid must see the exit.
+        assert cli._child_is_running(sleeper.pid) is False
+        assert cli._is_process_running(sleeper.pid) is False
+        assert sleeper.poll() is not None  # WNOWAIT left it reapable
+
+    def test_non_child_falls_back_to_kill(self):
+        assert cli._child_is_running(os.getpid()) is None
+        assert cli._is_process_running(os.getpid()) is True
+
+
+# ---------------------------------------------------------------------------
+# _wait_for_exit
+# ---------------------------------------------------------------------------
+
+
+class TestWaitForExit:
+    """Tests for blocking until a server process exits."""
+
+    def test_times_out_while_process_runs(self, sleeper):
+        assert cli._wait_for_exit(sleeper.pid, 0.05) is False
+
+    def test_returns_true_once_process_exits(self, sleeper):
+        sleeper.kill()
+        assert cli._wait_for_exit(sleeper.pid, 2.0) is True
+
+    def test_repeat_call_checks_again(self, sleeper):
+        """A second wait on the same pid must not reuse the first answer."""
+        assert cli._wait_for_exit(sleeper.pid, 0.2) is False
+        sleeper.kill()
+        assert cli._wait_for_exit(sleeper.pid, 0.2) is True
+
+
+# ---------------------------------------------------------------------------
+# _bind_sockets
+# ---------------------------------------------------------------------------
+
+
+class TestBindSockets:
+    """Tests for binding the TCP and Unix-domain listening sockets."""
+
+    def test_binds_unix_socket_at_given_path(self):
+        # AF_UNIX paths are limited to ~104 bytes, so keep the directory short.
+        tmp_dir = tempfile.TemporaryDirectory(dir="/tmp")
+        path = Path(tmp_dir.name) / "run" / "events.sock"
+        sockets = cli._bind_sockets(0, path)
+        try:
+            assert len(sockets) == 2
+            assert sockets[1].family == socket.AF_UNIX
+            assert sockets[1].getsockname() == str(path)
+        finally:
+            for sock in sockets:
+                sock.close()
+            tmp_dir.cleanup()
+
+
+# ---------------------------------------------------------------------------
+# _run_server shutdown
+# ---------------------------------------------------------------------------
+
+
+class _SignalledServer:
+    """Stand-in for uvicorn.Server that receives SIGTERM while serving."""
+
+    instances: list = []
+
+    def __init__(self, config) -> None:
+        self.should_exit = False
+        _SignalledServer.instances.append(self)
+
+    def run(self, sockets=None) -> None:
+        os.kill(os.getpid(), signal.SIGTERM)
+
+
+class TestRunServerShutdown:
+    """SIGTERM during serving shuts down gracefully and cleans up."""
+
+    def test_sigterm_requests_exit_and_removes_files(
+        self, echo_dir, short_socket_path, monkeypatch
+    ):
+        echo_logger = logging.getLogger("echo")
+        monkeypatch.setattr(echo_logger, "handlers", [logging.NullHandler()])
+        monkeypatch.setattr(echo_logger, "level", echo_logger.level)
+        monkeypatch.setattr("uvicorn.Server", _SignalledServer)
+        monkeypatch.setattr("uvicorn.Config", lambda *args, **kwargs: None)
+        monkeypatch.setattr("echo.server.app.create_app", lambda: object())
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        _SignalledServer.instances.clear()
+
+        cli._atomic_write_pid(os.getpid())
+        cli._run_server(0)
+
+        assert _SignalledServer.instances[0].should_exit is True
+        assert not cli.PID_FILE.exists()
+        assert not short_socket_path.exists()
+        assert signal.getsignal(signal.SIGTERM) is previous_handler
+
+
+# ---------------------------------------------------------------------------
+# _daemonize
+# ---------------------------------------------------------------------------
+
+
+class TestDaemonize:
+    """Tests for spawning the background server."""
+
+    def test_spawns_daemon_child_and_records_pid(self, echo_dir, monkeypatch):
+        calls = []
+
+        def fake_spawn(path, argv, env, **kwargs):
+            calls.append((path, argv, kwargs))
+            return 4321
+
+        monkeypatch.setattr(cli.os, "posix_spawn", fake_spawn)
+        cli._daemonize(7865)
+
+        path, argv, kwargs = calls[0]
+        assert path == sys.executable
+        assert argv[1:3] == ["-c", cli._DAEMON_BOOTSTRAP]
+        assert argv[-2:] == ["_daemon_child", "7865"]
+        assert kwargs["setsid"] is True
+        opened = {action[1]: action[2] for action in kwargs["file_actions"]
+                  if action[0] == os.POSIX_SPAWN_OPEN}
+        assert opened == {0: os.devnull, 1: str(echo_dir / "server.log")}
+        assert cli._read_pid() == 4321
+
+
+    def test_kills_child_when_pid_file_cannot_be_written(
+        self, echo_dir, sleeper, monkeypatch
+    ):
+        def failing_write(pid):
+            raise OSError("read-only file system")
+
+        monkeypatch.setattr(cli.os, "posix_spawn", lambda *a, **kw: sleeper.pid)
+        monkeypatch.setattr(cli, "_atomic_write_pid", failing_write)
+
+        with pytest.raises(OSError):
+            cli._daemonize(7865)
+
+        # _daemonize reaps the child itself, so only its absence is visible.
+        assert sleeper.poll() is not None
+
+    def test_bootstrap_ignores_shadowing_module_in_cwd(self, tmp_path):
+        """A user's echo.py in the working directory must not replace Echo."""
+        (tmp_path / "echo.py").write_text("print('SHADOWED')\n")
+        repo_root = Path(cli.__file__).resolve().parents[1]
+        env = {**os.environ, "PYTHONPATH": str(repo_root)}
+
+        result = subprocess.run(
+            [sys.executable, "-c", cli._DAEMON_BOOTSTRAP, "--help"],
+            cwd=tmp_path, env=env, capture_output=True, text=True, timeout=30,
+        )
+
+        assert result.returncode == 0
+        assert "SHADOWED" not in result.stdout
+        assert "Usage: echo-copilot" in result.stdout
+
+
+# ---------------------------------------------------------------------------
+# stop / status commands
+# ---------------------------------------------------------------------------
+
+
+class TestStopCommand:
+
+    def test_stop_terminates_server_and_removes_pid_file(self, echo_dir, sleeper):
+        cli._atomic_write_pid(sleeper.pid)
+
+        result = click.testing.CliRunner().invoke(cli.cli, ["stop"])
+
+        assert result.exit_code == 0
+        assert "Server stopped." in result.output
+        assert sleeper.wait(timeout=2.0) == -signal.SIGTERM
+        assert not cli.PID_FILE.exists()
+
+    def test_stop_removes_stale_pid_file(self, echo_dir, sleeper):
+        cli._atomic_write_pid(sleeper.pid)
+        sleeper.kill()
+        sleeper.wait()
+
+        result = click.testing.CliRunner().invoke(cli.cli, ["stop"])
+
+        assert "not running" in result.output
+        assert not cli.PID_FILE.exists()
+
+
+class TestStatusCommand:
+
+    def test_status_fetches_health_once(self, echo_dir, monkeypatch):
+        client = MagicMock()
+        client.get.return_value = httpx.Response(
+            200, json={"version": "1.2.3", "subscribers": 2}
+        )
+        monkeypatch.setattr(cli, "_health_client", lambda port: client)
+        cli._atomic_write_pid(os.getpid())
+
+        result = click.testing.CliRunner().invoke(cli.cli, ["status"])
+
+        assert result.exit_code == 0
+        assert "Server is healthy." in result.output
+        assert "1.2.3" in result.output
+        client.get.assert_called_once_with("/health")
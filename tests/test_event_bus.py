@@ -96,6 +96,43 @@ class TestEmit:
         # Queue still has exactly 2 items (the third was dropped)
         assert queue.qsize() == 2
 
+    async def test_emit_drops_oldest_for_drop_oldest_subscriber(self):
+        """A drop_oldest subscriber keeps the newest events when full."""
+        bus = EventBus(maxsize=2)
+        queue = await bus.subscribe(drop_oldest=True)
+        e1, e2, e3 = _make_event(), _make_event(), _make_event()
+
+        await bus.emit(e1)
+        await bus.emit(e2)
+        await bus.emit(e3)
+
+        assert queue.qsize() == 2
+        assert queue.get_nowait() is e2
+        assert queue.get_nowait() is e3
+
+    async def test_dropped_count_tracks_both_policies(self):
+        bus = EventBus(maxsize=1)
+        await bus.subscribe()
+        await bus.subscribe(drop_oldest=True)
+        assert bus.dropped_count == 0
+
+        await bus.emit(_make_event())
+        await bus.emit(_make_event())
+
+        assert bus.dropped_count == 2
+
+    async def test_drop_oldest_only_applies_to_its_subscriber(self):
+        bus = EventBus(maxsize=1)
+        keep_first = await bus.subscribe()
+        keep_latest = await bus.subscribe(drop_oldest=True)
+        e1, e2 = _make_event(), _make_event()
+
+        await bus.emit(e1)
+        await bus.emit(e2)
+
+        assert keep_first.get_nowait() is e1
+        assert keep_latest.get_nowait() is e2
+
 
 class TestUnsubscribe:
     """Tests for EventBus.unsubscribe()."""
@@ -2,6 +2,9 @@
 
 import time
 
+import pytest
+from pydantic import ValidationError
+
 from echo.events.types import BlockReason, EventType, EchoEvent
 
 
@@ -102,6 +105,24 @@ class TestEchoEvent:
         )
         assert event.timestamp == 1234567890.0
 
+    def test_default_event_id_is_unique_hex(self):
+        first = EchoEvent(type=EventType.SESSION_START, session_id="s1", source="hook")
+        second = EchoEvent(type=EventType.SESSION_START, session_id="s1", source="hook")
+        assert len(first.event_id) == 32
+        int(first.event_id, 16)
+        assert first.event_id != second.event_id
+
+    def test_event_is_frozen(self):
+        event = EchoEvent(type=EventType.SESSION_START, session_id="s1", source="hook")
+        with pytest.raises(ValidationError):
+            event.session_id = "s2"
+
+    def test_extra_fields_are_ignored(self):
+        event = EchoEvent(
+            type=EventType.SESSION_START, session_id="s1", source="hook", bogus=1
+        )
+        assert not hasattr(event, "bogus")
+
     def test_source_accepts_hook(self):
         event = EchoEvent(
             type=EventType.SESSION_START,
@@ -222,3 +243,30 @@ class TestEchoEvent:
         )
         rebuilt = EchoEvent(**original.model_dump())
         assert rebuilt == original
+
+    def test_json_str_matches_model_dump_json_and_is_cached(self):
+        event = EchoEvent(
+            type=EventType.TOOL_EXECUTED,
+            session_id="s1",
+            source="hook",
+            timestamp=1000.0,
+            tool_name="Read",
+        )
+        first = event.json_str()
+        assert first == event.model_dump_json()
+        assert event.json_str() is first
+
+    def test_sse_frame_matches_sse_starlette_encoding(self):
+        from sse_starlette.event import ServerSentEvent
+
+        event = EchoEvent(
+            type=EventType.AGENT_BLOCKED,
+            session_id="s1",
+            source="hook",
+            message="line one\nline two",
+        )
+        expected = ServerSentEvent(
+            event="agent_blocked", data=event.json_str()
+        ).encode()
+        assert event.sse_frame() == expected
+        assert event.sse_frame() is event.sse_frame()
@@ -122,6 +122,18 @@ class TestParseNotification:
         assert event is not None
         assert event.block_reason == BlockReason.IDLE_PROMPT
 
+    def test_notification_keyword_priority_beats_position(self):
+        """Permission wins over idle even when idle appears first in the message."""
+        raw = {
+            "hook_event_name": "Notification",
+            "session_id": "sess-750",
+            "type": "",
+            "message": "Agent went idle\nwaiting for PERMISSION",
+        }
+        event = parse_hook_event(raw)
+        assert event is not None
+        assert event.block_reason == BlockReason.PERMISSION_PROMPT
+
     def test_notification_with_unknown_type_and_no_keywords(self):
         """When neither type nor message yield a keyword, block_reason is None."""
         raw = {
@@ -556,3 +568,46 @@ class TestEdgeCases:
         event = parse_hook_event(raw)
         assert event is not None
         assert event.type == EventType.SESSION_START
+
+    def test_malformed_tool_input_returns_none(self):
+        """Wrongly-typed payload fields still go through validation and fail."""
+        raw = {
+            "hook_event_name": "PostToolUse",
+            "session_id": "sess-1800",
+            "tool_name": "Bash",
+            "tool_input": "not a dict",
+        }
+        event = parse_hook_event(raw)
+        assert event is None
+
+    def test_null_session_id_returns_none(self):
+        """A null session_id fails validation instead of taking the fast path."""
+        raw = {
+            "hook_event_name": "Stop",
+            "session_id": None,
+        }
+        event = parse_hook_event(raw)
+        assert event is None
+
+    def test_fast_path_event_has_defaults_and_serializes(self):
+        raw = {
+            "hook_event_name": "PostToolUse",
+            "session_id": "sess-1900",
+            "tool_name": "Bash",
+            "tool_input": {"command": "ls"},
+        }
+        event = parse_hook_event(raw)
+        assert event is not None
+        assert event.event_id
+        assert event.timestamp > 0
+        assert event.block_reason is None
+        assert '"type":"tool_executed"' in event.model_dump_json()
+
+    def test_non_string_hook_event_name_returns_none(self):
+        raw = {
+            "hook_event_name": ["PostToolUse"],
+            "session_id": "sess-2000",
+        }
+        event = parse_hook_event(raw)
+        assert event is None
+
@@ -8,6 +8,8 @@ from unittest.mock import AsyncMock, MagicMock
 import numpy as np
 import pytest
 
+import echo.config
+
 
 # ---------------------------------------------------------------------------
 # Helpers: build a fake ``livekit`` package so the module can be imported
@@ -101,9 +103,10 @@ def mock_livekit(monkeypatch):
         monkeypatch.setitem(sys.modules, "sounddevice", MagicMock(name="sounddevice"))
 
     # Provide valid credentials by default
-    monkeypatch.setattr("echo.config.LIVEKIT_URL", "wss://test.livekit.cloud")
-    monkeypatch.setattr("echo.config.LIVEKIT_API_KEY", "test-key")
-    monkeypatch.setattr("echo.config.LIVEKIT_API_SECRET", "test-secret")
+    monkeypatch.setenv("LIVEKIT_URL", "wss://test.livekit.cloud")
+    monkeypatch.setenv("LIVEKIT_API_KEY", "test-key")
+    monkeypatch.setenv("LIVEKIT_API_SECRET", "test-secret")
+    echo.config._reset_for_tests()
 
     # Force-reimport so the module picks up the mocked livekit SDK
     if "echo.tts.livekit_publisher" in sys.modules:
@@ -121,6 +124,7 @@ def mock_livekit(monkeypatch):
 
     mocks["module"] = mod
     yield mocks
+    echo.config._reset_for_tests()
 
 
 @pytest.fixture()
@@ -4,12 +4,15 @@ import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import orjson
 import pytest
 
 from echo.events.types import EventType, EchoEvent
 from echo.summarizer.llm_summarizer import (
     LLMSummarizer,
+    _MAX_PROMPT_TEXT_LENGTH,
     _MAX_TRUNCATION_LENGTH,
+    _SUMMARY_CACHE_SIZE,
     _TRUNCATED_LENGTH,
 )
 from echo.summarizer.types import (
@@ -239,8 +242,8 @@ class TestLLMSummarizerSummarize:
 
         assert result.source_event_type == EventType.AGENT_MESSAGE
 
-    async def test_ollama_empty_response_returns_empty_text(self):
-        """When Ollama returns an empty string, the narration text should be empty."""
+    async def test_ollama_empty_response_falls_back_to_truncation(self):
+        """When Ollama returns an empty string, the message is truncated instead."""
         summarizer = LLMSummarizer()
         summarizer._ollama_available = True
         summarizer._client = AsyncMock()
@@ -251,8 +254,8 @@ class TestLLMSummarizerSummarize:
         event = _make_agent_message_event()
         result = await summarizer.summarize(event)
 
-        assert result.text == ""
-        assert result.summarization_method == SummarizationMethod.LLM
+        assert result.text == event.text
+        assert result.summarization_method == SummarizationMethod.TRUNCATION
 
 
 # ---------------------------------------------------------------------------
@@ -290,6 +293,23 @@ class TestLLMSummarizerFallback:
         assert result.summarization_method == SummarizationMethod.TRUNCATION
         assert result.text == "Some text."
 
+    async def test_connect_error_marks_ollama_unavailable(self):
+        """A refused connection should stop further POSTs until the next re-check."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            side_effect=httpx.ConnectError("Connection refused")
+        )
+
+        await summarizer.summarize(_make_agent_message_event(text="First."))
+        result = await summarizer.summarize(_make_agent_message_event(text="Second."))
+
+        assert summarizer.is_available is False
+        assert result.summarization_method == SummarizationMethod.TRUNCATION
+        summarizer._client.post.assert_awaited_once()
+        summarizer._client.get.assert_not_awaited()
+
     async def test_ollama_http_error_falls_back_to_truncation(self):
         """When Ollama returns an HTTP error status, should fall back to truncation."""
         summarizer = LLMSummarizer()
@@ -318,6 +338,123 @@ class TestLLMSummarizerFallback:
         assert result.text == "Some text."
 
 
+# ---------------------------------------------------------------------------
+# TestSummaryCache — repeated text reuses the Ollama summary
+# ---------------------------------------------------------------------------
+
+
+class TestSummaryCache:
+    """Tests for the per-summarizer cache of Ollama summaries."""
+
+    async def test_repeated_text_calls_ollama_once(self):
+        """The same text summarized twice should hit Ollama only once."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            return_value=_mock_generate_response("Fixed the bug.")
+        )
+
+        first = await summarizer.summarize(
+            _make_agent_message_event(text="Long message", event_id="evt-1")
+        )
+        second = await summarizer.summarize(
+            _make_agent_message_event(text="Long message", event_id="evt-2")
+        )
+
+        assert summarizer._client.post.await_count == 1
+        assert second.text == first.text == "Fixed the bug."
+        assert second.summarization_method == SummarizationMethod.LLM
+        assert second.source_event_id == "evt-2"
+
+    async def test_whitespace_only_difference_reuses_summary(self):
+        """Text differing only in whitespace should share a cache entry."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            return_value=_mock_generate_response("Fixed the bug.")
+        )
+
+        await summarizer.summarize(
+            _make_agent_message_event(text="Fixed the\n  auth bug. ")
+        )
+        await summarizer.summarize(
+            _make_agent_message_event(text="Fixed the auth bug.")
+        )
+
+        assert summarizer._client.post.await_count == 1
+
+    async def test_different_wording_is_not_reused(self):
+        """Text that differs in content should still be summarized afresh."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            return_value=_mock_generate_response("Summary.")
+        )
+
+        await summarizer.summarize(_make_agent_message_event(text="Tests pass."))
+        await summarizer.summarize(_make_agent_message_event(text="Tests fail."))
+
+        assert summarizer._client.post.await_count == 2
+
+    async def test_failed_summary_is_not_cached(self):
+        """A truncation fallback should not be cached as an LLM summary."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            side_effect=[
+                httpx.ReadTimeout("Generation timed out"),
+                _mock_generate_response("Summary."),
+            ]
+        )
+
+        event = _make_agent_message_event(text="Some text.")
+        first = await summarizer.summarize(event)
+        second = await summarizer.summarize(event)
+
+        assert first.summarization_method == SummarizationMethod.TRUNCATION
+        assert second.summarization_method == SummarizationMethod.LLM
+        assert summarizer._client.post.await_count == 2
+
+    async def test_empty_summary_is_not_cached(self):
+        """An empty LLM reply should not be replayed for later identical text."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            side_effect=[
+                _mock_generate_response(""),
+                _mock_generate_response("Summary."),
+            ]
+        )
+
+        event = _make_agent_message_event(text="Some text.")
+        await summarizer.summarize(event)
+        second = await summarizer.summarize(event)
+
+        assert second.text == "Summary."
+        assert summarizer._client.post.await_count == 2
+
+    async def test_cache_evicts_oldest_entry(self):
+        """The cache should hold at most _SUMMARY_CACHE_SIZE summaries."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            return_value=_mock_generate_response("Summary.")
+        )
+
+        for i in range(_SUMMARY_CACHE_SIZE + 1):
+            await summarizer.summarize(_make_agent_message_event(text=f"msg {i}"))
+        assert len(summarizer._summary_cache) == _SUMMARY_CACHE_SIZE
+
+        await summarizer.summarize(_make_agent_message_event(text="msg 0"))
+        assert summarizer._client.post.await_count == _SUMMARY_CACHE_SIZE + 2
+
+
 # ---------------------------------------------------------------------------
 # TestTruncation — truncation logic
 # ---------------------------------------------------------------------------
@@ -502,6 +639,51 @@ class TestConfigValues:
             call_kwargs = MockClient.call_args
             assert "timeout" in call_kwargs.kwargs
 
+    async def test_generate_request_caps_message_length(self):
+        """Only the first _MAX_PROMPT_TEXT_LENGTH characters go into the prompt."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            return_value=_mock_generate_response("Summary.")
+        )
+
+        text = "A" * _MAX_PROMPT_TEXT_LENGTH + "B" * 500
+        await summarizer.summarize(_make_agent_message_event(text=text))
+
+        prompt = orjson.loads(summarizer._client.post.call_args.kwargs["content"])["prompt"]
+        assert "A" * _MAX_PROMPT_TEXT_LENGTH in prompt
+        assert "B" not in prompt
+
+    @pytest.mark.parametrize("reply", ["\n", "Summary:"])
+    async def test_empty_or_label_only_reply_falls_back_to_truncation(self, reply):
+        """A reply cut at a leading newline or a label line is not narrated."""
+        summarizer = LLMSummarizer()
+        summarizer._ollama_available = True
+        summarizer._client = AsyncMock()
+        summarizer._client.post = AsyncMock(
+            return_value=_mock_generate_response(reply)
+        )
+
+        result = await summarizer.summarize(_make_agent_message_event(text="Some text."))
+
+        assert result.summarization_method == SummarizationMethod.TRUNCATION
+        assert result.text == "Some text."
+
+    async def test_client_keeps_idle_connection_alive(self):
+        """AsyncClient should keep idle connections longer than httpx's default."""
+        summarizer = LLMSummarizer()
+
+        with patch("echo.summarizer.llm_summarizer.httpx.AsyncClient") as MockClient:
+            instance = AsyncMock()
+            instance.get = AsyncMock(return_value=_mock_health_response(200))
+            MockClient.return_value = instance
+
+            await summarizer.start()
+
+            call_kwargs = MockClient.call_args
+            assert call_kwargs.kwargs["limits"].keepalive_expiry == 60.0
+
     async def test_generate_request_uses_ollama_model(self):
         """POST to /api/generate should include the configured model name."""
         summarizer = LLMSummarizer()
@@ -515,7 +697,9 @@ class TestConfigValues:
         await summarizer.summarize(event)
 
         call_args = summarizer._client.post.call_args
-        json_body = call_args.kwargs.get("json") or call_args[1].get("json")
+        json_body = orjson.loads(call_args.kwargs["content"])
+        assert call_args.kwargs["headers"]["Content-Type"] == "application/json"
         assert json_body["model"] is not None
         assert json_body["stream"] is False
         assert "prompt" in json_body
+        assert json_body["options"]["stop"] == ["\n"]
@@ -339,23 +339,30 @@ class TestCancel:
 
 
 # ---------------------------------------------------------------------------
-# _compute_rms
+# _mean_square
 # ---------------------------------------------------------------------------
 
-class TestComputeRms:
+class TestMeanSquare:
 
-    def test_compute_rms_silence(self):
+    def test_mean_square_silence(self):
         data = np.zeros((1600, 1), dtype=np.int16)
-        rms = MicrophoneCapture._compute_rms(data)
-        assert rms == 0.0
-
-    def test_compute_rms_loud(self):
-        # Max int16 values
-        data = np.full((1600, 1), 32767, dtype=np.int16)
-        rms = MicrophoneCapture._compute_rms(data)
-        # Should be very close to 1.0 (32767/32768 ~ 0.99997)
-        assert rms > 0.99
-        assert rms <= 1.0
+        assert MicrophoneCapture._mean_square(data) == 0.0
+
+    def test_mean_square_full_scale_does_not_overflow(self):
+        data = np.full((1600, 1), -32768, dtype=np.int16)
+        assert MicrophoneCapture._mean_square(data) == 32768.0 ** 2
+
+    def test_mean_square_empty(self):
+        data = np.zeros((0, 1), dtype=np.int16)
+        assert MicrophoneCapture._mean_square(data) == 0.0
+
+    def test_squared_threshold_matches_rms_threshold(self):
+        """mean_square > (t * 32768) ** 2 exactly when RMS > t."""
+        threshold_ms = (0.01 * 32768.0) ** 2
+        quiet = np.full((1600, 1), 300, dtype=np.int16)  # RMS ~0.0092
+        loud = np.full((1600, 1), 400, dtype=np.int16)  # RMS ~0.0122
+        assert MicrophoneCapture._mean_square(quiet) < threshold_ms
+        assert MicrophoneCapture._mean_square(loud) > threshold_ms
 
 
 # ---------------------------------------------------------------------------
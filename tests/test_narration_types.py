@@ -316,3 +316,27 @@ class TestNarrationEvent:
         import json
         parsed = json.loads(json_str)
         assert parsed["options"] == ["main", "develop", "feature/x"]
+
+    def test_narration_is_frozen(self):
+        event = NarrationEvent(
+            text="Done.",
+            priority=NarrationPriority.NORMAL,
+            source_event_type=EventType.AGENT_STOPPED,
+            summarization_method=SummarizationMethod.TEMPLATE,
+            session_id="s1",
+        )
+        with pytest.raises(ValidationError):
+            event.text = "changed"
+
+    def test_json_str_is_cached(self):
+        event = NarrationEvent(
+            text="Done.",
+            priority=NarrationPriority.NORMAL,
+            source_event_type=EventType.AGENT_STOPPED,
+            summarization_method=SummarizationMethod.TEMPLATE,
+            session_id="s1",
+            timestamp=5000.0,
+        )
+        first = event.json_str()
+        assert json.loads(first)["text"] == "Done."
+        assert event.json_str() is first
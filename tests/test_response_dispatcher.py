@@ -1,5 +1,6 @@
 """Tests for echo.stt.response_dispatcher — ResponseDispatcher."""
 
+import os
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -159,7 +160,7 @@ class TestDispatch:
         assert result is True
 
     async def test_dispatch_xdotool_success(self, dispatcher, monkeypatch, mock_no_dispatch_env):
-        """Mock subprocess success for xdotool -> True (two subprocess calls)."""
+        """Mock subprocess success for xdotool -> True."""
         monkeypatch.setattr(
             "asyncio.create_subprocess_exec", _mock_subprocess_success
         )
@@ -247,19 +248,29 @@ class TestEdgeCases:
         result = await dispatcher.dispatch("hello")
         assert result is False
 
-    async def test_xdotool_type_succeeds_but_key_return_fails(self, dispatcher, monkeypatch, mock_no_dispatch_env):
-        """First xdotool call succeeds, second (key Return) fails -> False."""
-        call_count = 0
+    async def test_xdotool_types_text_and_return_in_one_call(self, dispatcher, monkeypatch, mock_no_dispatch_env):
+        """Text and Enter are sent by a single xdotool invocation."""
+        calls = []
 
-        async def alternating_subprocess(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return _make_mock_proc(returncode=0)
-            return _make_mock_proc(returncode=1, stderr=b"key failed")
+        async def recording_subprocess(*args, **kwargs):
+            calls.append(args)
+            return _make_mock_proc(returncode=0)
 
         monkeypatch.setattr(
-            "asyncio.create_subprocess_exec", alternating_subprocess
+            "asyncio.create_subprocess_exec", recording_subprocess
+        )
+        dispatcher._available = True
+        dispatcher._method = "xdotool"
+
+        result = await dispatcher.dispatch("-y please")
+        assert result is True
+        assert calls == [
+            ("xdotool", "type", "--clearmodifiers", "--", "-y please\n")
+        ]
+
+    async def test_xdotool_failure_returns_false(self, dispatcher, monkeypatch, mock_no_dispatch_env):
+        monkeypatch.setattr(
+            "asyncio.create_subprocess_exec", _mock_subprocess_failure
         )
         dispatcher._available = True
         dispatcher._method = "xdotool"
@@ -272,3 +283,125 @@ class TestEdgeCases:
         await dispatcher.stop()
         assert dispatcher.is_available is False
         assert dispatcher.method is None
+
+    async def test_applescript_passes_text_as_argument(self, dispatcher, monkeypatch, mock_no_dispatch_env):
+        """Text goes to osascript as argv, unescaped, not spliced into the script."""
+        calls = []
+
+        async def recording_subprocess(*args, **kwargs):
+            calls.append(args)
+            return _make_mock_proc(returncode=0)
+
+        monkeypatch.setattr(
+            "asyncio.create_subprocess_exec", recording_subprocess
+        )
+        dispatcher._available = True
+        dispatcher._method = "applescript"
+
+        result = await dispatcher.dispatch('say "hi" \\ bye')
+        assert result is True
+        assert calls[0][0] == "osascript"
+        assert calls[0][-1] == 'say "hi" \\ bye'
+
+    async def test_applescript_compiled_once_and_reused(self, dispatcher, monkeypatch, mock_no_dispatch_env):
+        """start() compiles the script; dispatch runs the compiled file."""
+        calls = []
+
+        async def recording_subprocess(*args, **kwargs):
+            calls.append(args)
+            return _make_mock_proc(returncode=0)
+
+        monkeypatch.setattr(
+            "asyncio.create_subprocess_exec", recording_subprocess
+        )
+        monkeypatch.setattr("sys.platform", "darwin")
+        monkeypatch.setattr("shutil.which", lambda cmd: f"/usr/bin/{cmd}")
+        monkeypatch.setattr(
+            "echo.stt.response_dispatcher.DISPATCH_PASTE_THRESHOLD", 0
+        )
+
+        await dispatcher.start()
+        assert dispatcher.method == "applescript"
+        assert calls[0][0] == "osacompile"
+        compiled = calls[0][calls[0].index("-o") + 1]
+
+        await dispatcher.dispatch("first")
+        await dispatcher.dispatch("second")
+        assert len(calls) == 3  # paste script not compiled when disabled
+        assert calls[1] == ("osascript", compiled, "first")
+        assert calls[2] == ("osascript", compiled, "second")
+
+        await dispatcher.stop()
+        assert not os.path.exists(compiled)
+
+    async def test_forced_applescript_is_compiled(self, dispatcher, monkeypatch):
+        """Forcing DISPATCH_METHOD='applescript' still precompiles the script."""
+        calls = []
+
+        async def recording_subprocess(*args, **kwargs):
+            calls.append(args)
+            return _make_mock_proc(returncode=0)
+
+        monkeypatch.setattr(
+            "asyncio.create_subprocess_exec", recording_subprocess
+        )
+        monkeypatch.setattr(
+            "echo.stt.response_dispatcher.DISPATCH_METHOD", "applescript"
+        )
+        monkeypatch.setattr("shutil.which", lambda cmd: f"/usr/bin/{cmd}")
+        monkeypatch.setattr(
+            "echo.stt.response_dispatcher.DISPATCH_PASTE_THRESHOLD", 0
+        )
+
+        await dispatcher.start()
+        assert dispatcher.method == "applescript"
+        assert calls[0][0] == "osacompile"
+        compiled = calls[0][calls[0].index("-o") + 1]
+
+        await dispatcher.dispatch("hello")
+        assert calls[1] == ("osascript", compiled, "hello")
+
+        await dispatcher.stop()
+
+    async def test_applescript_pastes_long_text_when_enabled(self, dispatcher, monkeypatch, mock_no_dispatch_env):
+        """Text over DISPATCH_PASTE_THRESHOLD uses the clipboard script."""
+        calls = []
+
+        async def recording_subprocess(*args, **kwargs):
+            calls.append(args)
+            return _make_mock_proc(returncode=0)
+
+        monkeypatch.setattr(
+            "asyncio.create_subprocess_exec", recording_subprocess
+        )
+        monkeypatch.setattr(
+            "echo.stt.response_dispatcher.DISPATCH_PASTE_THRESHOLD", 10
+        )
+        dispatcher._available = True
+        dispatcher._method = "applescript"
+
+        assert await dispatcher.dispatch("short") is True
+        assert await dispatcher.dispatch("a much longer response") is True
+        assert "the clipboard" not in calls[0][2]
+        assert "the clipboard" in calls[1][2]
+        assert calls[1][-1] == "a much longer response"
+
+    async def test_applescript_never_pastes_by_default(self, dispatcher, monkeypatch, mock_no_dispatch_env):
+        """With the threshold at its default of 0, long text is still typed."""
+        calls = []
+
+        async def recording_subprocess(*args, **kwargs):
+            calls.append(args)
+            return _make_mock_proc(returncode=0)
+
+        monkeypatch.setattr(
+            "asyncio.create_subprocess_exec", recording_subprocess
+        )
+        monkeypatch.setattr(
+            "echo.stt.response_dispatcher.DISPATCH_PASTE_THRESHOLD", 0
+        )
+        dispatcher._available = True
+        dispatcher._method = "applescript"
+
+        assert await dispatcher.dispatch("x" * 500) is True
+        assert "the clipboard" not in calls[0][2]
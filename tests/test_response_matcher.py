@@ -82,6 +82,18 @@ class TestOrdinalMatching:
         assert result.matched_text == "HS256"
         assert result.method == MatchMethod.ORDINAL
 
+    def test_ordinal_with_punctuation(self, matcher: ResponseMatcher):
+        """Whisper punctuation ("Option two.") does not hide the ordinal."""
+        result = matcher.match("Option two.", _OPTIONS_3)
+        assert result.matched_text == "HS256"
+        assert result.method == MatchMethod.ORDINAL
+
+    def test_out_of_range_ordinal_skipped(self, matcher: ResponseMatcher):
+        """An ordinal past the end of the list falls through to the next one."""
+        result = matcher.match("not five, two", _OPTIONS_3)
+        assert result.matched_text == "HS256"
+        assert result.method == MatchMethod.ORDINAL
+
 
 # ---------------------------------------------------------------------------
 # Yes/No matching
@@ -181,7 +193,7 @@ class TestDirectMatching:
 
 
 class TestFuzzyMatching:
-    """SequenceMatcher-based fuzzy matching."""
+    """RapidFuzz-based fuzzy matching."""
 
     def test_fuzzy_match_above_threshold(self, matcher: ResponseMatcher):
         options = ["approve", "reject"]
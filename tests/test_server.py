@@ -102,6 +102,15 @@ class TestPostEvent:
         assert body["status"] == "error"
         assert body["reason"] == "invalid json"
 
+    async def test_post_non_object_json_returns_error(
+        self, async_client: httpx.AsyncClient
+    ):
+        response = await async_client.post("/event", json=["SessionStart"])
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "error"
+        assert body["reason"] == "invalid json"
+
     async def test_post_event_emits_to_bus(
         self, async_client: httpx.AsyncClient, event_bus: EventBus
     ):
@@ -154,6 +163,20 @@ class TestHealthEndpoint:
         body = response.json()
         assert body["subscribers"] == 1
 
+    async def test_health_returns_dropped_event_count(
+        self, async_client: httpx.AsyncClient, event_bus: EventBus, sample_event
+    ):
+        response = await async_client.get("/health")
+        body = response.json()
+        assert body["dropped_events"] == 0
+        assert body["narration_dropped_events"] == 0
+
+        queue = await event_bus.subscribe()
+        for _ in range(queue.maxsize + 1):
+            await event_bus.emit(sample_event)
+        response = await async_client.get("/health")
+        assert response.json()["dropped_events"] == 1
+
 
 # ---------------------------------------------------------------------------
 # GET /events (SSE stream)
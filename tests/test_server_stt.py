@@ -209,6 +209,13 @@ class TestPostRespond:
         assert body["status"] == "error"
         assert body["reason"] == "invalid json"
 
+    async def test_respond_non_object_json(self, stt_client: httpx.AsyncClient):
+        response = await stt_client.post("/respond", json=["sess-001", "yes"])
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "error"
+        assert body["reason"] == "invalid json"
+
     async def test_respond_missing_session_id(self, stt_client: httpx.AsyncClient):
         response = await stt_client.post(
             "/respond",
@@ -278,8 +285,8 @@ class TestCLINoSTTFlag:
         with patch("echo.cli._run_server"), \
              patch("echo.cli._daemonize"), \
              patch("echo.cli._read_pid", return_value=None), \
+             patch("echo.cli._atomic_write_pid"), \
              patch("echo.cli.PID_FILE") as mock_pid:
-            mock_pid.write_text = lambda x: None
             mock_pid.unlink = lambda missing_ok=True: None
             result = runner.invoke(cli, ["start", "--no-stt", "--skip-hooks"])
 
@@ -133,8 +133,8 @@ class TestCLINoTTSFlag:
         with patch("echo.cli._run_server"), \
              patch("echo.cli._daemonize"), \
              patch("echo.cli._read_pid", return_value=None), \
+             patch("echo.cli._atomic_write_pid"), \
              patch("echo.cli.PID_FILE") as mock_pid:
-            mock_pid.write_text = lambda x: None
             mock_pid.unlink = lambda missing_ok=True: None
             result = runner.invoke(cli, ["start", "--no-tts", "--skip-hooks"])
 
@@ -154,8 +154,8 @@ class TestCLINoTTSFlag:
         with patch("echo.cli._run_server"), \
              patch("echo.cli._daemonize"), \
              patch("echo.cli._read_pid", return_value=None), \
+             patch("echo.cli._atomic_write_pid"), \
              patch("echo.cli.PID_FILE") as mock_pid:
-            mock_pid.write_text = lambda x: None
             mock_pid.unlink = lambda missing_ok=True: None
             result = runner.invoke(cli, ["start", "--skip-hooks"])
 
@@ -189,3 +189,40 @@ class TestAppIntegration:
         """The TTSEngine should be wired to the same narration_bus as the app."""
         tts = app.state.tts_engine
         assert tts._narration_bus is narration_bus
+
+
+# ---------------------------------------------------------------------------
+# GET /test-tts
+# ---------------------------------------------------------------------------
+
+
+class TestTestTTSEndpoint:
+    """Verify the /test-tts diagnostic endpoint."""
+
+    async def test_provider_unavailable_reports_error(
+        self, async_client: httpx.AsyncClient
+    ):
+        response = await async_client.get("/test-tts")
+        body = response.json()
+        assert body["tts_available"] is False
+        assert body["error"] == "TTS provider not available"
+
+    async def test_playback_is_queued_after_response(
+        self, async_client: httpx.AsyncClient, tts_engine: TTSEngine
+    ):
+        tts_engine._provider.is_available = True
+        tts_engine._provider.synthesize = AsyncMock(return_value=b"\x00\x01" * 8)
+        with patch(
+            "echo.tts.tts_engine.AudioPlayer.is_available",
+            new_callable=PropertyMock,
+            return_value=True,
+        ), patch.object(
+            tts_engine._player, "play_immediate", new_callable=AsyncMock
+        ) as play:
+            response = await async_client.get("/test-tts")
+
+        body = response.json()
+        assert body["pcm_bytes"] == 16
+        assert body["played"] is True
+        assert body["playback_queued"] is True
+        play.assert_awaited_once_with(b"\x00\x01" * 8)
@@ -17,10 +17,10 @@ from echo.stt.stt_client import STTClient
 
 
 def _mock_health_response(status_code: int = 200) -> httpx.Response:
-    """Build a fake httpx.Response for GET /v1/models."""
+    """Build a fake httpx.Response for GET /v1/models/{model}."""
     return httpx.Response(
         status_code=status_code,
-        request=httpx.Request("GET", "/v1/models"),
+        request=httpx.Request("GET", "/v1/models/whisper-1"),
     )
 
 
@@ -298,6 +298,66 @@ class TestTranscribe:
 class TestHealthCheck:
     """Tests for health check behavior."""
 
+    async def test_health_check_looks_up_configured_model(self, monkeypatch):
+        """The probe fetches only the configured model, not the full list."""
+        monkeypatch.setattr("echo.stt.stt_client.STT_MODEL", "whisper-1")
+        client = STTClient()
+        client._client = AsyncMock()
+        client._client.get = AsyncMock(return_value=_mock_health_response(200))
+
+        await client._check_health()
+
+        client._client.get.assert_awaited_once_with("/v1/models/whisper-1")
+        assert client.is_available is True
+
+    async def test_health_check_quotes_model_id(self, monkeypatch):
+        """Model ids containing '/' stay a single path segment."""
+        monkeypatch.setattr(
+            "echo.stt.stt_client.STT_MODEL", "Systran/faster-whisper-small"
+        )
+        client = STTClient()
+        client._client = AsyncMock()
+        client._client.get = AsyncMock(return_value=_mock_health_response(200))
+
+        await client._check_health()
+
+        client._client.get.assert_awaited_once_with(
+            "/v1/models/Systran%2Ffaster-whisper-small"
+        )
+
+    @pytest.mark.parametrize("status_code", [404, 405])
+    async def test_health_check_falls_back_to_model_list(self, monkeypatch, status_code):
+        """Servers without the single-model endpoint are probed via /v1/models."""
+        monkeypatch.setattr("echo.stt.stt_client.STT_MODEL", "whisper-1")
+        client = STTClient()
+        client._client = AsyncMock()
+        client._client.get = AsyncMock(
+            side_effect=[
+                _mock_health_response(status_code),
+                _mock_health_response(200),
+            ]
+        )
+
+        await client._check_health()
+
+        assert client._client.get.await_args_list[1].args == ("/v1/models",)
+        assert client.is_available is True
+
+    async def test_health_check_fallback_failure_is_unavailable(self, monkeypatch):
+        monkeypatch.setattr("echo.stt.stt_client.STT_MODEL", "whisper-1")
+        client = STTClient()
+        client._client = AsyncMock()
+        client._client.get = AsyncMock(
+            side_effect=[
+                _mock_health_response(404),
+                _mock_health_response(401),
+            ]
+        )
+
+        await client._check_health()
+
+        assert client.is_available is False
+
     async def test_maybe_recheck_when_available_skips(self):
         """When already available, _maybe_recheck_health should not re-check."""
         client = STTClient()
@@ -515,6 +575,22 @@ class TestClientConfiguration:
                 "Authorization": "Bearer sk-my-secret-key"
             }
 
+    async def test_client_keeps_idle_connection_alive(self, monkeypatch):
+        """AsyncClient should keep idle connections longer than httpx's default."""
+        monkeypatch.setattr("echo.stt.stt_client.STT_API_KEY", "test-key")
+
+        with patch.object(STTClient, "_check_health", AsyncMock()):
+            client = STTClient()
+            await client.start()
+
+        pool = client._client._transport._pool
+        try:
+            assert pool._keepalive_expiry == 60.0
+            assert pool._max_keepalive_connections == 4
+            assert pool._retries == 1
+        finally:
+            await client.stop()
+
     async def test_is_available_default_false(self):
         """A fresh instance should not be available."""
         client = STTClient()
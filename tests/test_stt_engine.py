@@ -155,6 +155,19 @@ class TestLifecycle:
         mock_stt_client.stop.assert_awaited_once()
         mock_microphone.stop.assert_awaited_once()
 
+    async def test_stop_continues_when_a_component_fails(
+        self, engine, mock_microphone, mock_stt_client, mock_dispatcher
+    ):
+        """One sub-component raising on stop does not skip the others."""
+        await engine.start()
+        mock_stt_client.stop = AsyncMock(side_effect=RuntimeError("close failed"))
+        mock_microphone.stop.reset_mock()
+        mock_dispatcher.stop.reset_mock()
+
+        await engine.stop()
+        mock_dispatcher.stop.assert_awaited_once()
+        mock_microphone.stop.assert_awaited_once()
+
     async def test_stop_unsubscribes_from_bus(self, engine, event_bus):
         await engine.start()
         assert event_bus.subscriber_count == 1
@@ -343,6 +356,23 @@ class TestEventHandling:
         assert engine._current_session == _SESSION
         await engine.stop()
 
+    async def test_consume_loop_drains_queued_burst(self, engine, event_bus):
+        """Events queued together are all handled, in order, in one wakeup."""
+        handled = []
+
+        async def record(event):
+            handled.append(event.session_id)
+
+        engine._handle_event = record
+        await engine.start()
+        for sid in ("s1", "s2", "s3"):
+            await event_bus.emit(_make_event(EventType.TOOL_EXECUTED, session_id=sid))
+        await asyncio.sleep(0.05)
+
+        assert handled == ["s1", "s2", "s3"]
+        assert engine._queue.empty()
+        await engine.stop()
+
     async def test_consume_loop_handles_exception(
         self, engine, event_bus, mock_microphone, mock_stt_client
     ):
@@ -569,6 +599,138 @@ class TestManualResponse:
         await response_bus.unsubscribe(queue)
 
 
+# ---------------------------------------------------------------------------
+# Confirmation tests
+# ---------------------------------------------------------------------------
+
+
+class TestConfirmation:
+    """Tests for the spoken "Sending: ..." confirmation."""
+
+    def _engine_with_tts(self, event_bus):
+        mock_tts = MagicMock()
+        mock_tts._provider.synthesize = AsyncMock(return_value=_PCM_BYTES)
+        mock_tts._player.play_immediate = AsyncMock()
+        return STTEngine(event_bus, tts_engine=mock_tts), mock_tts
+
+    async def test_repeated_confirmation_is_synthesized_once(
+        self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus
+    ):
+        eng, mock_tts = self._engine_with_tts(event_bus)
+        match = MatchResult(matched_text="yes", confidence=0.9, method=MatchMethod.YES_NO)
+
+        await eng._confirm_and_dispatch(match, _SESSION)
+        await eng._confirm_and_dispatch(match, _SESSION)
+
+        mock_tts._provider.synthesize.assert_awaited_once_with("Sending: yes")
+        assert mock_tts._player.play_immediate.await_count == 2
+
+    async def test_dispatch_overlaps_confirmation_playback(
+        self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus
+    ):
+        """Dispatch does not wait for the confirmation to finish playing."""
+        eng, mock_tts = self._engine_with_tts(event_bus)
+        finish_playback = asyncio.Event()
+
+        async def slow_play(pcm):
+            # Only dispatch can end playback, so running them in sequence
+            # would hang until the wait_for timeout below.
+            await finish_playback.wait()
+
+        async def dispatch(text):
+            finish_playback.set()
+            return True
+
+        mock_tts._player.play_immediate = AsyncMock(side_effect=slow_play)
+        mock_dispatcher.dispatch = AsyncMock(side_effect=dispatch)
+        match = MatchResult(matched_text="RS256", confidence=0.95, method=MatchMethod.ORDINAL)
+
+        await asyncio.wait_for(eng._confirm_and_dispatch(match, _SESSION), timeout=1.0)
+
+        mock_dispatcher.dispatch.assert_awaited_once_with("RS256")
+        mock_tts._player.play_immediate.assert_awaited_once()
+
+    async def test_playback_failure_does_not_block_dispatch(
+        self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus
+    ):
+        eng, mock_tts = self._engine_with_tts(event_bus)
+        mock_tts._player.play_immediate = AsyncMock(side_effect=RuntimeError("device lost"))
+        match = MatchResult(matched_text="RS256", confidence=0.95, method=MatchMethod.ORDINAL)
+
+        await eng._confirm_and_dispatch(match, _SESSION)
+
+        mock_dispatcher.dispatch.assert_awaited_once_with("RS256")
+
+    async def test_dispatch_error_cancels_confirmation_playback(
+        self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus
+    ):
+        eng, mock_tts = self._engine_with_tts(event_bus)
+        playback_started = asyncio.Event()
+        playback_cancelled = asyncio.Event()
+
+        async def endless_play(pcm):
+            playback_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                playback_cancelled.set()
+                raise
+
+        async def failing_dispatch(text):
+            await playback_started.wait()
+            raise RuntimeError("xdotool died")
+
+        mock_tts._player.play_immediate = AsyncMock(side_effect=endless_play)
+        mock_dispatcher.dispatch = AsyncMock(side_effect=failing_dispatch)
+        match = MatchResult(matched_text="RS256", confidence=0.95, method=MatchMethod.ORDINAL)
+
+        with pytest.raises(RuntimeError):
+            await eng._confirm_and_dispatch(match, _SESSION)
+
+        await asyncio.wait_for(playback_cancelled.wait(), timeout=1.0)
+
+    async def test_cancelled_listen_cancels_confirmation_playback(
+        self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus
+    ):
+        """Cancelling the listen task (alert resolved elsewhere) stops playback."""
+        eng, mock_tts = self._engine_with_tts(event_bus)
+        playback_started = asyncio.Event()
+        playback_cancelled = asyncio.Event()
+
+        async def endless_play(pcm):
+            playback_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                playback_cancelled.set()
+                raise
+
+        mock_tts._player.play_immediate = AsyncMock(side_effect=endless_play)
+        match = MatchResult(matched_text="RS256", confidence=0.95, method=MatchMethod.ORDINAL)
+
+        task = asyncio.create_task(eng._confirm_and_dispatch(match, _SESSION))
+        await asyncio.wait_for(playback_started.wait(), timeout=1.0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.wait_for(playback_cancelled.wait(), timeout=1.0)
+
+    async def test_confirmation_cache_evicts_oldest(
+        self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus, monkeypatch
+    ):
+        monkeypatch.setattr("echo.stt.stt_engine._CONFIRM_PCM_CACHE_SIZE", 2)
+        eng, mock_tts = self._engine_with_tts(event_bus)
+
+        for text in ("one", "two", "three"):
+            await eng._confirm_and_dispatch(
+                MatchResult(matched_text=text, confidence=0.95, method=MatchMethod.ORDINAL),
+                _SESSION,
+            )
+
+        assert list(eng._confirm_pcm_cache) == ["Sending: two", "Sending: three"]
+
+
 # ---------------------------------------------------------------------------
 # Response bus emission tests
 # ---------------------------------------------------------------------------
@@ -658,22 +820,56 @@ class TestWaitForTts:
         eng = STTEngine(event_bus, tts_engine=mock_tts)
         await asyncio.wait_for(eng._wait_for_tts(), timeout=2.0)
 
-    async def test_wait_for_tts_fallback_polls_flag(
+    async def test_wait_for_tts_skips_engine_without_event(
         self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus, monkeypatch
     ):
-        """When _critical_complete attr is missing, falls back to polling boolean."""
+        """When _critical_complete is missing, returns without polling."""
         monkeypatch.setattr("echo.stt.stt_engine._TTS_WAIT_INITIAL", 0.01)
         mock_tts = MagicMock(spec=[])  # No attributes
-        mock_tts._processing_critical = True
+        mock_tts._processing_critical = True  # Ignored: nothing to await
 
-        async def clear_flag():
-            await asyncio.sleep(0.1)
-            mock_tts._processing_critical = False
+        eng = STTEngine(event_bus, tts_engine=mock_tts)
+        await asyncio.wait_for(eng._wait_for_tts(), timeout=0.5)
 
-        asyncio.create_task(clear_flag())
+    async def test_wait_for_tts_start_handshake_replaces_fixed_delay(
+        self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus, monkeypatch
+    ):
+        """With a source event id, waits for TTS to start that alert, not a fixed sleep."""
+        monkeypatch.setattr("echo.stt.stt_engine._TTS_WAIT_INITIAL", 10.0)
+        mock_tts = MagicMock()
+        mock_tts._critical_complete = asyncio.Event()
+        mock_tts._critical_complete.set()
+        mock_tts._critical_started = asyncio.Condition()
+        mock_tts._critical_source_id = "older-event"
+
+        async def start_critical():
+            await asyncio.sleep(0.05)
+            async with mock_tts._critical_started:
+                mock_tts._critical_complete.clear()
+                mock_tts._critical_source_id = "evt-1"
+                mock_tts._critical_started.notify_all()
+            await asyncio.sleep(0.05)
+            mock_tts._critical_complete.set()
 
+        task = asyncio.create_task(start_critical())
         eng = STTEngine(event_bus, tts_engine=mock_tts)
-        await asyncio.wait_for(eng._wait_for_tts(), timeout=2.0)
+        await asyncio.wait_for(eng._wait_for_tts("evt-1"), timeout=2.0)
+        assert mock_tts._critical_complete.is_set()
+        await task
+
+    async def test_wait_for_tts_start_times_out(
+        self, mock_microphone, mock_stt_client, mock_dispatcher, mock_matcher, event_bus, monkeypatch
+    ):
+        """If TTS never starts the alert, capture proceeds after the start timeout."""
+        monkeypatch.setattr("echo.stt.stt_engine._TTS_START_TIMEOUT", 0.05)
+        mock_tts = MagicMock()
+        mock_tts._critical_complete = asyncio.Event()
+        mock_tts._critical_complete.set()
+        mock_tts._critical_started = asyncio.Condition()
+        mock_tts._critical_source_id = None
+
+        eng = STTEngine(event_bus, tts_engine=mock_tts)
+        await asyncio.wait_for(eng._wait_for_tts("evt-1"), timeout=1.0)
 
     async def test_cancel_called_before_task_cancel(
         self, engine, event_bus, mock_microphone
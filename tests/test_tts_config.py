@@ -1,13 +1,23 @@
 """Tests for TTS-related configuration constants in echo.config."""
 
-import importlib
+import dataclasses
+
+import pytest
+
+import echo.config
 
 
 def _reload_config():
-    """Force-reload echo.config so env-var changes take effect."""
-    import echo.config
+    """Drop cached settings in echo.config so env-var changes take effect."""
+    echo.config._reset_for_tests()
+    return echo.config
 
-    return importlib.reload(echo.config)
+
+@pytest.fixture(autouse=True)
+def _fresh_config():
+    """Keep settings read under a test's env vars from leaking into others."""
+    yield
+    echo.config._reset_for_tests()
 
 
 # ---------------------------------------------------------------------------
@@ -241,6 +251,11 @@ class TestSTTConfigDefaults:
         cfg = _reload_config()
         assert cfg.DISPATCH_METHOD == ""
 
+    def test_dispatch_paste_threshold_default(self, monkeypatch):
+        monkeypatch.delenv("ECHO_DISPATCH_PASTE_THRESHOLD", raising=False)
+        cfg = _reload_config()
+        assert cfg.DISPATCH_PASTE_THRESHOLD == 0
+
 
 # ---------------------------------------------------------------------------
 # STT environment variable overrides
@@ -305,6 +320,11 @@ class TestSTTConfigEnvOverrides:
         cfg = _reload_config()
         assert cfg.DISPATCH_METHOD == "tmux"
 
+    def test_dispatch_paste_threshold_override(self, monkeypatch):
+        monkeypatch.setenv("ECHO_DISPATCH_PASTE_THRESHOLD", "40")
+        cfg = _reload_config()
+        assert cfg.DISPATCH_PASTE_THRESHOLD == 40
+
 
 # ---------------------------------------------------------------------------
 # STT type checks
@@ -456,3 +476,49 @@ class TestInworldConfigTypes:
         assert isinstance(cfg.INWORLD_TIMEOUT, float)
         assert isinstance(cfg.INWORLD_TEMPERATURE, float)
         assert isinstance(cfg.INWORLD_SPEAKING_RATE, float)
+
+
+# ---------------------------------------------------------------------------
+# Settings accessors
+# ---------------------------------------------------------------------------
+
+
+class TestSettingsAccessors:
+    """Verify the cached per-section settings accessors."""
+
+    def test_accessor_matches_flat_constant(self, monkeypatch):
+        monkeypatch.setenv("ECHO_ELEVENLABS_API_KEY", "abc")
+        cfg = _reload_config()
+        assert cfg.elevenlabs_settings().api_key == "abc"
+        assert cfg.ELEVENLABS_API_KEY == "abc"
+
+    def test_accessor_is_cached(self):
+        cfg = _reload_config()
+        assert cfg.stt_settings() is cfg.stt_settings()
+
+    def test_settings_are_frozen(self):
+        cfg = _reload_config()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.livekit_settings().url = "wss://other"
+
+    def test_unknown_attribute_raises(self):
+        cfg = _reload_config()
+        with pytest.raises(AttributeError):
+            cfg.NOT_A_SETTING
+
+
+# ---------------------------------------------------------------------------
+# Event socket path
+# ---------------------------------------------------------------------------
+
+
+class TestEventSocketConfig:
+    """ECHO_EVENT_SOCKET is shared by the server and the hook script."""
+
+    def test_event_socket_default(self, monkeypatch):
+        monkeypatch.delenv("ECHO_EVENT_SOCKET", raising=False)
+        assert echo.config.get_event_socket() == echo.config.EVENT_SOCKET
+
+    def test_event_socket_env_override(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ECHO_EVENT_SOCKET", str(tmp_path / "hooks.sock"))
+        assert echo.config.get_event_socket() == tmp_path / "hooks.sock"
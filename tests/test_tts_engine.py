@@ -755,6 +755,27 @@ class TestAlertManagerIntegration:
         assert eng._processing_critical is False
         await eng.stop()
 
+    async def test_critical_start_records_source_event_id(
+        self, mock_provider, mock_player, mock_livekit, narration_bus
+    ):
+        """Starting critical playback publishes the narration's source event id."""
+        eng = TTSEngine(narration_bus)
+        assert eng._critical_source_id is None
+
+        narration = _make_narration("Alert!", NarrationPriority.CRITICAL)
+        narration = narration.model_copy(update={"source_event_id": "evt-1"})
+
+        async def wait_for_start():
+            async with eng._critical_started:
+                await eng._critical_started.wait_for(
+                    lambda: eng._critical_source_id == "evt-1"
+                )
+
+        waiter = asyncio.create_task(wait_for_start())
+        await asyncio.sleep(0)
+        await eng._handle_critical(narration)
+        await asyncio.wait_for(waiter, timeout=1.0)
+
     async def test_processing_critical_flag_cleared_on_error(
         self, mock_provider, mock_player, mock_livekit, narration_bus, monkeypatch
     ):